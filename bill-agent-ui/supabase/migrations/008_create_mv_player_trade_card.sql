@@ -0,0 +1,66 @@
+-- Materialized view pairing each player-season consistency row with the
+-- player's dynasty ranking, so trade evaluation reads both in one indexed
+-- lookup instead of a consistency query plus a 500-row vw_dynasty_ranks scan.
+--
+-- Rankings are matched on lower(player) = merge_name via LATERAL LIMIT 1 (best
+-- ECR across page types) so players listed on several rank pages don't fan out.
+-- Players without consistency rows (e.g. rookies) are not in this view; callers
+-- fall back to the cached vw_dynasty_ranks lookup for those.
+--
+-- Used by:
+--   get_trade_context() in tools/trade/info.py (trade evaluation bundles)
+--
+-- Refresh with: REFRESH MATERIALIZED VIEW CONCURRENTLY mv_player_trade_card;
+-- (refresh after mv_player_consistency so both reflect the same weekly load)
+-- Scheduled via pg_cron: daily at 7:30 AM UTC (job: refresh-mv-player-trade-card)
+
+DROP MATERIALIZED VIEW IF EXISTS mv_player_trade_card;
+
+CREATE MATERIALIZED VIEW mv_player_trade_card AS
+SELECT
+    c.season,
+    c.player_name,
+    c.merge_name,
+    c.ff_position,
+    c.ff_team,
+    c.games_played,
+    c.avg_fp_ppr,
+    c.fp_stddev_ppr,
+    c.fp_floor_p10,
+    c.fp_ceiling_p90,
+    c.fp_median_ppr,
+    c.boom_games_20plus,
+    c.bust_games_under_5,
+    c.consistency_coefficient,
+    r.ecr,
+    r.pos AS rank_pos,
+    r.team AS rank_team
+FROM mv_player_consistency c
+LEFT JOIN LATERAL (
+    SELECT dr.ecr, dr.pos, dr.team
+    FROM vw_dynasty_ranks dr
+    WHERE lower(dr.player) = c.merge_name
+    ORDER BY dr.ecr
+    LIMIT 1
+) r ON true
+WITH NO DATA;
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+-- (same key as mv_player_consistency, which this view extends one-to-one)
+CREATE UNIQUE INDEX idx_mv_player_trade_card_player_season
+    ON mv_player_trade_card (player_name, season, ff_position, ff_team);
+
+-- Trigram index for the trade tool's batched merge_name ILIKE lookups
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX idx_mv_player_trade_card_merge_name_trgm
+    ON mv_player_trade_card USING gin (merge_name gin_trgm_ops);
+
+-- Grant read access through the API
+GRANT SELECT ON mv_player_trade_card TO anon, authenticated, service_role;
+
+-- NOTE: After applying this migration, populate the view via direct DB connection:
+--   psql $DATABASE_URL -c "SET statement_timeout = '120s'; REFRESH MATERIALIZED VIEW mv_player_trade_card;"
+--
+-- pg_cron job refreshes daily at 7:30 AM UTC (after mv_player_consistency and rankings loads):
+--   SELECT cron.schedule('refresh-mv-player-trade-card', '30 7 * * *',
+--     $$SET statement_timeout = '120s'; REFRESH MATERIALIZED VIEW CONCURRENTLY mv_player_trade_card;$$);
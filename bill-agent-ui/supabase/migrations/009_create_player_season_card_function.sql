@@ -0,0 +1,68 @@
+-- RPC returning recent seasonal receiving, passing, and rushing rows for a batch
+-- of players in one call, replacing three separate PostgREST view queries.
+--
+-- Each category takes its own name list so callers can skip players whose
+-- position the category cannot cover (an empty array prunes that category).
+-- Names are matched with ILIKE '%name%' against merge_name, like the PostgREST
+-- name filters, in a single scan per view; ROW_NUMBER() keeps the most recent
+-- rows_per_name seasons for each requested name. Column lists are applied
+-- server-side so only the requested columns cross the wire.
+--
+-- Used by:
+--   get_start_sit_context() in tools/startsit/info.py (season stats for start/sit)
+--
+-- Returns one row per (lookup name, category, season) with the stats row as jsonb.
+
+CREATE OR REPLACE FUNCTION public.player_season_card(
+    receiving_names text[],
+    passing_names text[],
+    rushing_names text[],
+    receiving_cols text[],
+    passing_cols text[],
+    rushing_cols text[],
+    rows_per_name int DEFAULT 3
+)
+RETURNS TABLE(lookup_name text, category text, stats jsonb)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH receiving AS (
+        SELECT n.lookup, to_jsonb(v) AS full_row,
+               ROW_NUMBER() OVER (PARTITION BY n.lookup ORDER BY v.season DESC, v.player_name) AS rn
+        FROM vw_advanced_receiving_analytics v
+        JOIN unnest(receiving_names) AS n(lookup) ON v.merge_name ILIKE '%' || n.lookup || '%'
+        WHERE v.ff_position IN ('WR', 'TE', 'RB')
+    ),
+    passing AS (
+        SELECT n.lookup, to_jsonb(v) AS full_row,
+               ROW_NUMBER() OVER (PARTITION BY n.lookup ORDER BY v.season DESC, v.player_name) AS rn
+        FROM vw_advanced_passing_analytics v
+        JOIN unnest(passing_names) AS n(lookup) ON v.merge_name ILIKE '%' || n.lookup || '%'
+        WHERE v.ff_position IN ('QB')
+    ),
+    rushing AS (
+        SELECT n.lookup, to_jsonb(v) AS full_row,
+               ROW_NUMBER() OVER (PARTITION BY n.lookup ORDER BY v.season DESC, v.player_name) AS rn
+        FROM vw_advanced_rushing_analytics v
+        JOIN unnest(rushing_names) AS n(lookup) ON v.merge_name ILIKE '%' || n.lookup || '%'
+        WHERE v.ff_position IN ('RB', 'QB')
+    ),
+    cards AS (
+        SELECT lookup, 'receiving' AS category, rn,
+               (SELECT jsonb_object_agg(e.key, e.value) FROM jsonb_each(full_row) e WHERE e.key = ANY(receiving_cols)) AS stats
+        FROM receiving WHERE rn <= rows_per_name
+        UNION ALL
+        SELECT lookup, 'passing', rn,
+               (SELECT jsonb_object_agg(e.key, e.value) FROM jsonb_each(full_row) e WHERE e.key = ANY(passing_cols))
+        FROM passing WHERE rn <= rows_per_name
+        UNION ALL
+        SELECT lookup, 'rushing', rn,
+               (SELECT jsonb_object_agg(e.key, e.value) FROM jsonb_each(full_row) e WHERE e.key = ANY(rushing_cols))
+        FROM rushing WHERE rn <= rows_per_name
+    )
+    SELECT lookup, category, stats FROM cards ORDER BY category, lookup, rn;
+$$;
+
+-- Grant execute through the API
+GRANT EXECUTE ON FUNCTION public.player_season_card(text[], text[], text[], text[], text[], text[], int)
+    TO anon, authenticated, service_role;
@@ -0,0 +1,47 @@
+-- Materialized view of current-season weekly fantasy stats for skill players.
+-- Start/sit's weekly lookup (one week, a handful of names) is the hottest query
+-- shape on game days; this narrows it from the multi-season, wide
+-- nflreadr_nfl_player_stats table to one season and the columns it reads.
+--
+-- Used by:
+--   get_start_sit_context() in tools/startsit/info.py (weekly stats when no season is given)
+--
+-- Refresh with: REFRESH MATERIALIZED VIEW CONCURRENTLY mv_weekly_stats_current;
+-- Scheduled via pg_cron: hourly during the season (job: refresh-mv-weekly-stats-current)
+
+DROP MATERIALIZED VIEW IF EXISTS mv_weekly_stats_current;
+
+CREATE MATERIALIZED VIEW mv_weekly_stats_current AS
+SELECT
+    ps.season,
+    ps.week,
+    ps.player_id,
+    ps.player_display_name,
+    ps.recent_team,
+    ps.position,
+    ps.fantasy_points,
+    ps.fantasy_points_ppr
+FROM nflreadr_nfl_player_stats ps
+WHERE ps.season = (SELECT MAX(season) FROM nflreadr_nfl_player_stats)
+  AND ps.position IN ('QB', 'RB', 'WR', 'TE')
+WITH NO DATA;
+
+-- Unique index required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+-- Keyed on player_id because display names are not unique (e.g. two Mike Williams)
+CREATE UNIQUE INDEX idx_mv_weekly_stats_current_season_week_player
+    ON mv_weekly_stats_current (season, week, player_id);
+
+-- Trigram index for player_display_name ILIKE lookups
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX idx_mv_weekly_stats_current_display_name_trgm
+    ON mv_weekly_stats_current USING gin (player_display_name gin_trgm_ops);
+
+-- Grant read access through the API
+GRANT SELECT ON mv_weekly_stats_current TO anon, authenticated, service_role;
+
+-- NOTE: After applying this migration, populate the view via direct DB connection:
+--   psql $DATABASE_URL -c "REFRESH MATERIALIZED VIEW mv_weekly_stats_current;"
+--
+-- pg_cron job refreshes hourly (cheap: one season of skill-position rows):
+--   SELECT cron.schedule('refresh-mv-weekly-stats-current', '0 * * * *',
+--     $$REFRESH MATERIALIZED VIEW CONCURRENTLY mv_weekly_stats_current;$$);
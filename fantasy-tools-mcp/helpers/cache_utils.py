@@ -0,0 +1,74 @@
+"""
+Small thread-safe TTL + LRU cache for per-player query results.
+
+Composite tools batch one query per data category across all requested players.
+Wrapping those batches with TTLCache.get_or_fetch_many serves players seen in the
+last few minutes from memory and queries Supabase only for the rest, so repeat
+players across sequential start/sit and trade calls cost no round-trips.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from helpers.name_utils import sanitize_name
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ttl seconds after they are stored."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 120):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def get_or_fetch_many(
+        self,
+        names: list[str],
+        fetch: Callable[[list[str]], dict[str, Any]],
+        key_fn: Callable[[str], Hashable] = sanitize_name,
+    ) -> dict[str, Any]:
+        """
+        Return {name: value} for names, fetching only uncached names in one call.
+
+        Names are keyed by their sanitized form by default, so spelling variants
+        of one player share an entry. Exceptions from fetch propagate and
+        nothing is cached for that call.
+
+        Args:
+            names: Raw player names
+            fetch: Called with the uncached names; returns {name: value}
+            key_fn: Maps a name to its cache key; override when results depend on more than the name
+        """
+        keys = {name: key_fn(name) for name in names}
+        results: dict[str, Any] = {}
+        misses: list[str] = []
+        now = time.monotonic()
+        with self._lock:
+            for name, key in keys.items():
+                entry = self._data.get(key)
+                if entry and (now - entry[1]) <= self.ttl:
+                    self._data.move_to_end(key)
+                    results[name] = entry[0]
+                else:
+                    misses.append(name)
+
+        if misses:
+            fetched = fetch(misses)
+            stored_at = time.monotonic()
+            with self._lock:
+                for name in misses:
+                    value = fetched.get(name)
+                    results[name] = value
+                    self._data[keys[name]] = (value, stored_at)
+                    self._data.move_to_end(keys[name])
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+        return results
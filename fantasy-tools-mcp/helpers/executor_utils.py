@@ -0,0 +1,22 @@
+"""
+Shared thread pool for composite tools' parallel Supabase fetches.
+
+Composite tools fan out their queries on threads (ThreadPoolExecutor avoids
+asyncio.run() conflicts with FastMCP's event loop). Reusing one long-lived pool
+avoids creating and tearing down a batch of OS threads on every tool call.
+
+Tasks submitted here must not themselves wait on other tasks in this pool,
+or a saturated pool can deadlock.
+"""
+
+import atexit
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Composite tools now issue one batched query per data category, so a call needs
+# only a handful of workers. Keep this at or below SUPABASE_MAX_KEEPALIVE so every
+# in-flight query can ride a warm PostgREST connection instead of queueing for one.
+FETCH_POOL_SIZE = int(os.getenv("FETCH_POOL_SIZE", "16"))
+
+FETCH_EXECUTOR = ThreadPoolExecutor(max_workers=FETCH_POOL_SIZE, thread_name_prefix="bill2-fetch")
+atexit.register(FETCH_EXECUTOR.shutdown)
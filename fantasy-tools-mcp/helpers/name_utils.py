@@ -19,3 +19,14 @@ def sanitize_name(name: str) -> str:
     s = _punct_re.sub("", s)
     s = _spaces_re.sub(" ", s).strip()
     return s.lower()
+
+
+def dedupe_names(names: list[str]) -> list[str]:
+    """Sanitize names and drop duplicates and empties, preserving first-seen order.
+
+    "Justin Jefferson", "justin jefferson" and "Justin  Jefferson" all collapse
+    to a single entry so callers emit one ILIKE clause per distinct player.
+    Names that sanitize to "" (whitespace, punctuation only) are dropped, since
+    an empty ILIKE pattern (%%) would match every row.
+    """
+    return list(dict.fromkeys(s for s in (sanitize_name(name) for name in names if name) if s))
@@ -2,10 +2,14 @@ import logging
 
 from supabase import Client
 
-from helpers.name_utils import sanitize_name
+from helpers.name_utils import dedupe_names, sanitize_name
+from helpers.retry_utils import is_retryable_http_error
 
 logger = logging.getLogger(__name__)
 
+# Hard cap on rows returned by a single build_player_stats_query call
+MAX_QUERY_LIMIT = 300
+
 
 def build_player_stats_query(
     supabase: Client,
@@ -23,6 +27,8 @@ def build_player_stats_query(
     limit: int | None = 25,
     positions: list[str] | None = None,
     player_sort_column: str = "player_name",
+    exact_names: list[str] | None = None,
+    player_sort_desc: bool = False,
 ) -> dict:
     """
     Generic query builder for player stats across different tables.
@@ -47,6 +53,10 @@ def build_player_stats_query(
         positions: Optional list of positions to filter. If None, uses default_positions.
         player_sort_column: Column name for secondary sort (ASC). Defaults to "player_name".
             Tables using "player_display_name" (e.g. nflreadr_nfl_player_stats) should pass that instead.
+        exact_names: Optional already-resolved values of player_name_column (e.g. merge_name keys from
+            mv_player_id_lookup). Matched with IN instead of ILIKE and takes precedence over player_names.
+        player_sort_desc: Sort player_sort_column DESC instead of ASC. A single-player weekly query
+            can pass player_sort_column="week" with this to get the most recent weeks first.
 
     Returns:
         dict: Query results with the specified return_key
@@ -92,8 +102,11 @@ def build_player_stats_query(
     if metrics:
         columns.extend(metrics)
 
-    # Sanitize and build optional name filter
-    sanitized_names = [sanitize_name(name) for name in player_names] if player_names else []
+    # Sanitize, dedupe and build optional name filter (skipped when exact keys are supplied)
+    sanitized_names = dedupe_names(player_names) if player_names and not exact_names else []
+    if player_names and not exact_names and not sanitized_names:
+        # Every name sanitized to "" — don't fall through to an unfiltered scan
+        return {return_key: []}
     or_filter = (
         ",".join([f"{player_name_column}.ilike.%{name}%" for name in sanitized_names]) if sanitized_names else None
     )
@@ -104,10 +117,9 @@ def build_player_stats_query(
     positions_list = [p.upper() for p in positions_list] if positions_list else None
 
     # Enforce sensible cap
-    max_limit = 300
     safe_limit = None
     if limit and int(limit) > 0:
-        safe_limit = min(int(limit), max_limit)
+        safe_limit = min(int(limit), MAX_QUERY_LIMIT)
 
     try:
         # Build base query
@@ -123,14 +135,16 @@ def build_player_stats_query(
         if positions_list:
             query = query.in_(position_column, positions_list)
 
-        if or_filter:
+        if exact_names:
+            query = query.in_(player_name_column, exact_names)
+        elif or_filter:
             query = query.or_(or_filter)
 
         # Apply ordering: prefer explicit metric, otherwise by season desc, player asc
         if order_by_metric:
             query = query.not_.is_(order_by_metric, "null")
             query = query.order(order_by_metric, desc=True)
-        query = query.order("season", desc=True).order(player_sort_column, desc=False)
+        query = query.order("season", desc=True).order(player_sort_column, desc=player_sort_desc)
 
         if safe_limit:
             query = query.limit(safe_limit)
@@ -140,4 +154,125 @@ def build_player_stats_query(
         return {return_key: response.data}
 
     except Exception as e:
+        # Transient transport/5xx errors keep their type so callers' retry_with_backoff can see them
+        if is_retryable_http_error(e):
+            raise
         raise Exception(f"Error fetching {return_key}: {e!s}") from None
+
+
+def group_rows_by_name(
+    rows: list[dict],
+    player_names: list[str],
+    name_columns: list[str],
+    per_name_limit: int | None = None,
+) -> dict[str, list[dict]]:
+    """
+    Split the rows of a batched multi-player query back into per-name buckets.
+
+    Mirrors the ``ILIKE %name%`` filter build_player_stats_query applies, so each
+    input name receives the rows its own single-name query would have matched.
+    Row order is preserved, so with the default season DESC ordering the first
+    ``per_name_limit`` rows per name are that player's most recent seasons.
+
+    Args:
+        rows: Rows returned by a query filtered on all of player_names at once
+        player_names: The raw names the query was built from
+        name_columns: Row columns to match against (any match counts)
+        per_name_limit: Optional max rows kept per name
+
+    Returns:
+        dict: Mapping of each input name to its matching rows (empty list if none)
+    """
+    keys = {name: sanitize_name(name) for name in player_names}
+    grouped: dict[str, list[dict]] = {name: [] for name in player_names}
+    for row in rows:
+        values = [str(row.get(col) or "").lower() for col in name_columns]
+        for name, key in keys.items():
+            if not key or (per_name_limit is not None and len(grouped[name]) >= per_name_limit):
+                continue
+            if any(key in value for value in values):
+                grouped[name].append(row)
+    return grouped
+
+
+def query_rows_per_name(
+    supabase: Client,
+    player_names: list[str],
+    name_columns: list[str],
+    rows_per_name: int,
+    headroom: int = 2,
+    **query_kwargs,
+) -> dict[str, list[dict]]:
+    """
+    Fetch up to rows_per_name rows for each of many players with one batched query.
+
+    The batched query is ordered season-major with no per-player cap, so when it
+    comes back full a player whose recent rows sort late (e.g. one who missed the
+    latest season) may have been cut off by other players' rows. In that case each
+    name left short of rows_per_name is re-queried on its own, as it was before
+    batching.
+
+    Args:
+        supabase: Supabase client instance
+        player_names: Raw names to look up
+        name_columns: Row columns used to split rows back per name (see group_rows_by_name)
+        rows_per_name: Max rows kept per name
+        headroom: Multiple of rows_per_name requested per name, leaving room for
+            partial-match neighbours (e.g. a second "Jefferson")
+        **query_kwargs: Remaining build_player_stats_query arguments (table_name, return_key, ...)
+
+    Returns:
+        dict: Mapping of each input name to its rows (empty list if none)
+    """
+    return_key = query_kwargs["return_key"]
+    limit = rows_per_name * len(player_names) * headroom
+    result = build_player_stats_query(supabase=supabase, player_names=player_names, limit=limit, **query_kwargs)
+    rows = result.get(return_key, [])
+    grouped = group_rows_by_name(rows, player_names, name_columns, rows_per_name)
+    if len(player_names) > 1 and len(rows) >= min(limit, MAX_QUERY_LIMIT):
+        for name, name_rows in grouped.items():
+            if len(name_rows) < rows_per_name:
+                single = build_player_stats_query(
+                    supabase=supabase, player_names=[name], limit=rows_per_name * headroom, **query_kwargs
+                )
+                single_rows = single.get(return_key, [])
+                grouped[name] = group_rows_by_name(single_rows, [name], name_columns, rows_per_name)[name]
+    return grouped
+
+
+def query_player_season_card(
+    supabase: Client,
+    names_by_category: dict[str, list[str]],
+    cols_by_category: dict[str, list[str]],
+    rows_per_name: int = 3,
+) -> dict[str, dict[str, list[dict]]]:
+    """
+    Fetch receiving, passing, and rushing season rows for many players in one RPC.
+
+    Calls the player_season_card database function, which matches each sanitized
+    name with ILIKE against merge_name and keeps the most recent rows_per_name
+    seasons per name and category, returning only the requested columns.
+
+    Args:
+        supabase: Supabase client instance
+        names_by_category: Raw names to look up per category ("receiving", "passing",
+            "rushing"); a missing or empty list skips that category
+        cols_by_category: Columns returned for each category's rows
+        rows_per_name: Most recent seasons kept per name and category
+
+    Returns:
+        dict: Mapping of each requested name to {category: rows} for its categories
+    """
+    # Names are matched by their sanitized form, which the function echoes back as lookup_name
+    params: dict = {f"{cat}_names": dedupe_names(names_by_category.get(cat, [])) for cat in cols_by_category}
+    params.update({f"{cat}_cols": cols for cat, cols in cols_by_category.items()})
+    params["rows_per_name"] = rows_per_name
+    rows = supabase.rpc("player_season_card", params).execute().data or []
+    by_lookup: dict[tuple[str, str], list[dict]] = {}
+    for r in rows:
+        by_lookup.setdefault((r["category"], r["lookup_name"]), []).append(r["stats"])
+    by_name: dict[str, dict[str, list[dict]]] = {}
+    for cat, names in names_by_category.items():
+        for n in names:
+            by_name.setdefault(n, {})[cat] = by_lookup.get((cat, sanitize_name(n)), [])
+    return by_name
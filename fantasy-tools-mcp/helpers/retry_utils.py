@@ -1,5 +1,5 @@
 """
-Retry utilities with exponential backoff for Sleeper API calls.
+Retry utilities with exponential backoff for Sleeper, Supabase, and web search calls.
 
 Uses tenacity library for robust retry logic.
 """
@@ -10,6 +10,7 @@ from functools import wraps
 from typing import Any, Callable
 
 import aiohttp
+import httpx
 import requests
 from tenacity import (
     AsyncRetrying,
@@ -19,6 +20,7 @@ from tenacity import (
     retry_if_exception,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
 )
 
 # Configure logging
@@ -29,7 +31,7 @@ def is_retryable_http_error(exception: Exception) -> bool:
     """
     Determine if an HTTP error should trigger a retry.
 
-    Supports both requests and aiohttp exceptions.
+    Supports requests, aiohttp, and httpx (Supabase/PostgREST) exceptions.
 
     Retries on:
     - 5xx server errors (temporary server issues)
@@ -73,6 +75,16 @@ def is_retryable_http_error(exception: Exception) -> bool:
         # Retry on 5xx (server errors) and 429 (rate limit)
         return status_code >= 500 or status_code == 429
 
+    # Connection and timeout errors are always retryable (httpx, used by supabase-py)
+    if isinstance(exception, httpx.TransportError):
+        return True
+
+    # Check HTTP errors by status code (httpx library)
+    if isinstance(exception, httpx.HTTPStatusError):
+        status_code = exception.response.status_code
+        # Retry on 5xx (server errors) and 429 (rate limit)
+        return status_code >= 500 or status_code == 429
+
     return False
 
 
@@ -81,6 +93,7 @@ def retry_with_backoff(
     initial_delay: float | None = None,
     max_delay: float | None = None,
     multiplier: float | None = None,
+    jitter: float | None = None,
 ) -> Callable:
     """
     Decorator that adds retry logic with exponential backoff to a function.
@@ -104,12 +117,14 @@ def retry_with_backoff(
     - RETRY_INITIAL_DELAY_MS: Initial delay in milliseconds (default: 1000)
     - RETRY_MAX_DELAY_MS: Maximum delay in milliseconds (default: 4000)
     - RETRY_BACKOFF_MULTIPLIER: Exponential backoff multiplier (default: 2)
+    - RETRY_JITTER_MS: Max random delay added to each wait, in milliseconds (default: 0)
 
     Args:
         max_attempts: Override for maximum retry attempts
         initial_delay: Override for initial delay in seconds
         max_delay: Override for maximum delay in seconds
         multiplier: Override for backoff multiplier
+        jitter: Override for the max random delay (seconds) added to each wait
 
     Returns:
         Decorated function with retry logic
@@ -136,6 +151,9 @@ def retry_with_backoff(
 
     _multiplier = multiplier if multiplier is not None else float(os.getenv("RETRY_BACKOFF_MULTIPLIER", "2"))
 
+    # Random jitter spreads out retries from concurrent callers that failed together
+    _jitter_s = jitter if jitter is not None else int(os.getenv("RETRY_JITTER_MS", "0")) / 1000.0
+
     def decorator(func: Callable) -> Callable:
         # Custom retry condition that checks if exception is retryable
         def should_retry(exception: Exception) -> bool:
@@ -153,7 +171,8 @@ def retry_with_backoff(
                 min=_initial_delay_s,
                 max=_max_delay_s,
                 exp_base=_multiplier,
-            ),
+            )
+            + wait_random(0, _jitter_s),
             # Only retry on specific retryable exceptions
             retry=retry_if_exception(should_retry),
             # Log before sleeping (retrying)
@@ -186,6 +205,7 @@ def async_retry_with_backoff(
     initial_delay: float | None = None,
     max_delay: float | None = None,
     multiplier: float | None = None,
+    jitter: float | None = None,
 ) -> Callable:
     """
     Decorator that adds retry logic with exponential backoff to an async function.
@@ -209,12 +229,14 @@ def async_retry_with_backoff(
     - RETRY_INITIAL_DELAY_MS: Initial delay in milliseconds (default: 1000)
     - RETRY_MAX_DELAY_MS: Maximum delay in milliseconds (default: 4000)
     - RETRY_BACKOFF_MULTIPLIER: Exponential backoff multiplier (default: 2)
+    - RETRY_JITTER_MS: Max random delay added to each wait, in milliseconds (default: 0)
 
     Args:
         max_attempts: Override for maximum retry attempts
         initial_delay: Override for initial delay in seconds
         max_delay: Override for maximum delay in seconds
         multiplier: Override for backoff multiplier
+        jitter: Override for the max random delay (seconds) added to each wait
 
     Returns:
         Decorated async function with retry logic
@@ -241,6 +263,9 @@ def async_retry_with_backoff(
 
     _multiplier = multiplier if multiplier is not None else float(os.getenv("RETRY_BACKOFF_MULTIPLIER", "2"))
 
+    # Random jitter spreads out retries from concurrent callers that failed together
+    _jitter_s = jitter if jitter is not None else int(os.getenv("RETRY_JITTER_MS", "0")) / 1000.0
+
     def decorator(func: Callable) -> Callable:
         # Custom retry condition that checks if exception is retryable
         def should_retry(exception: Exception) -> bool:
@@ -260,7 +285,8 @@ def async_retry_with_backoff(
                     min=_initial_delay_s,
                     max=_max_delay_s,
                     exp_base=_multiplier,
-                ),
+                )
+                + wait_random(0, _jitter_s),
                 # Only retry on specific retryable exceptions
                 retry=retry_if_exception(should_retry),
                 # Log before sleeping (retrying)
@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
+import orjson
 from fastmcp.server.middleware import Middleware, MiddlewareContext
 
 # ---------------------------------------------------------------------------
@@ -87,7 +88,21 @@ def log_tool_call(
     if error_message:
         record["error_message"] = error_message[:500]  # truncate long errors
 
-    _analytics_logger.info(json.dumps(record, separators=(",", ":")))
+    _analytics_logger.info(orjson.dumps(record).decode())
+
+
+def _result_text(result: object) -> str | None:
+    """Text content a tool result sends to the client, used for output token estimates.
+
+    Reads the already-serialized content blocks instead of str(result), which would
+    repr both the text and the structured payload of large composite bundles.
+    """
+    if result is None:
+        return None
+    content = getattr(result, "content", None)
+    if content is None:
+        return str(result)
+    return "".join(getattr(block, "text", None) or "" for block in content)
 
 
 # ---------------------------------------------------------------------------
@@ -100,15 +115,14 @@ class ToolAnalyticsMiddleware(Middleware):
 
     async def on_call_tool(self, context: MiddlewareContext, call_next):
         tool_name = context.message.name
-        input_text = json.dumps(context.message.arguments) if context.message.arguments else None
+        input_text = orjson.dumps(context.message.arguments).decode() if context.message.arguments else None
 
         start = time.monotonic()
         try:
             result = await call_next(context)
             duration_ms = (time.monotonic() - start) * 1000
 
-            # Serialize result for token estimation
-            output_text = str(result) if result is not None else None
+            output_text = _result_text(result)
 
             log_tool_call(
                 tool_name,
@@ -1,8 +1,9 @@
 import os
 
+import httpx
 from dotenv import load_dotenv
 from fastmcp import FastMCP
-from supabase import create_client
+from supabase import ClientOptions, create_client
 
 from helpers.tool_analytics import ToolAnalyticsMiddleware
 from tools.registry import register_tools
@@ -32,7 +33,26 @@ else:
 # Initialize Supabase client
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
-supabase = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+SUPABASE_MAX_CONNECTIONS = int(os.getenv("SUPABASE_MAX_CONNECTIONS", "64"))
+SUPABASE_MAX_KEEPALIVE = int(os.getenv("SUPABASE_MAX_KEEPALIVE", "32"))
+SUPABASE_TIMEOUT_S = float(os.getenv("SUPABASE_TIMEOUT_S", "30"))
+
+# Shared HTTP/2 session for every PostgREST call. Composite tools fan out many
+# concurrent queries; a pooled keep-alive client reuses TLS connections and
+# multiplexes requests instead of handshaking per .execute().
+http_client = httpx.Client(
+    http2=True,
+    limits=httpx.Limits(
+        max_keepalive_connections=SUPABASE_MAX_KEEPALIVE,
+        max_connections=SUPABASE_MAX_CONNECTIONS,
+    ),
+    timeout=SUPABASE_TIMEOUT_S,
+)
+supabase = create_client(
+    SUPABASE_URL,
+    SUPABASE_ANON_KEY,
+    options=ClientOptions(httpx_client=http_client, postgrest_client_timeout=SUPABASE_TIMEOUT_S),
+)
 
 # Initialize FastMCP
 mcp = FastMCP("Gridiron Tools MCP")
@@ -8,12 +8,15 @@ Tests the unified player profile tool with different player types:
 3. RB (should have rushing + receiving stats)
 """
 
+import functools
 import os
 import sys
+import traceback
 from pathlib import Path
 
+import httpx
 from dotenv import load_dotenv
-from supabase import create_client
+from supabase import ClientOptions, create_client
 
 from tools.player.info import get_player_profile
 
@@ -36,10 +39,21 @@ for env_path in possible_env_paths:
 if not env_loaded:
     print("WARNING: No .env file found. Using system environment variables.")
 
-# Initialize Supabase client
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_ANON_KEY = os.getenv("SUPABASE_ANON_KEY")
-supabase = create_client(SUPABASE_URL, SUPABASE_ANON_KEY)
+
+
+@functools.lru_cache(maxsize=1)
+def get_supabase_client():
+    """Create the Supabase client on first use and share it for the rest of the run."""
+    # Same keep-alive HTTP/2 session setup as main.py, so the profile's concurrent
+    # stat queries reuse one connection instead of handshaking per .execute()
+    http_client = httpx.Client(http2=True, timeout=30)
+    return create_client(
+        SUPABASE_URL,
+        SUPABASE_ANON_KEY,
+        options=ClientOptions(httpx_client=http_client, postgrest_client_timeout=30),
+    )
 
 
 def test_wide_receiver():
@@ -47,7 +61,7 @@ def test_wide_receiver():
     print("\n=== Testing WR: Justin Jefferson ===")
     try:
         result = get_player_profile(
-            supabase=supabase,
+            supabase=get_supabase_client(),
             player_names=["Justin Jefferson"],
             season_list=[2023, 2024],
             limit=25,
@@ -64,15 +78,17 @@ def test_wide_receiver():
                 print(f"❌ FAIL: Missing key '{key}' in response")
                 return False
 
-        # Verify player info is populated
-        if not result["playerInfo"]:
-            print("❌ FAIL: playerInfo is empty")
-            return False
+        # Remaining checks are collected so one run reports every failure
+        failures: list[str] = []
 
-        player = result["playerInfo"][0]
-        print(f"  ✓ Player: {player.get('display_name')}")
-        print(f"  ✓ Position: {player.get('position')}")
-        print(f"  ✓ Team: {player.get('latest_team')}")
+        # Verify player info is populated
+        if result["playerInfo"]:
+            player = result["playerInfo"][0]
+            print(f"  ✓ Player: {player.get('display_name')}")
+            print(f"  ✓ Position: {player.get('position')}")
+            print(f"  ✓ Team: {player.get('latest_team')}")
+        else:
+            failures.append("playerInfo is empty")
 
         # Verify receiving stats are populated (WR should have receiving stats)
         if result["receivingStats"]:
@@ -86,13 +102,16 @@ def test_wide_receiver():
         # Rushing stats might be empty for pure WR
         print(f"  ✓ Rushing stats: {len(result['rushingStats'])} records")
 
+        if failures:
+            for failure in failures:
+                print(f"❌ FAIL: {failure}")
+            return False
+
         print("✅ PASS: WR test successful")
         return True
 
     except Exception as e:
         print(f"❌ FAIL: Exception occurred: {e!s}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -102,7 +121,7 @@ def test_quarterback():
     print("\n=== Testing QB: Patrick Mahomes ===")
     try:
         result = get_player_profile(
-            supabase=supabase,
+            supabase=get_supabase_client(),
             player_names=["Patrick Mahomes"],
             season_list=[2023, 2024],
             limit=25,
@@ -119,22 +138,23 @@ def test_quarterback():
                 print(f"❌ FAIL: Missing key '{key}' in response")
                 return False
 
-        # Verify player info is populated
-        if not result["playerInfo"]:
-            print("❌ FAIL: playerInfo is empty")
-            return False
+        # Remaining checks are collected so one run reports every failure
+        failures: list[str] = []
 
-        player = result["playerInfo"][0]
-        print(f"  ✓ Player: {player.get('display_name')}")
-        print(f"  ✓ Position: {player.get('position')}")
-        print(f"  ✓ Team: {player.get('latest_team')}")
+        # Verify player info is populated
+        if result["playerInfo"]:
+            player = result["playerInfo"][0]
+            print(f"  ✓ Player: {player.get('display_name')}")
+            print(f"  ✓ Position: {player.get('position')}")
+            print(f"  ✓ Team: {player.get('latest_team')}")
+        else:
+            failures.append("playerInfo is empty")
 
         # Verify passing stats are populated (QB should have passing stats)
         if result["passingStats"]:
             print(f"  ✓ Passing stats: {len(result['passingStats'])} records")
         else:
-            print("  ❌ FAIL: No passing stats found (unexpected for QB)")
-            return False
+            failures.append("No passing stats found (unexpected for QB)")
 
         # QBs often have rushing stats
         if result["rushingStats"]:
@@ -145,13 +165,16 @@ def test_quarterback():
         # Receiving stats should be empty for QB
         print(f"  ✓ Receiving stats: {len(result['receivingStats'])} records (expected 0 for QB)")
 
+        if failures:
+            for failure in failures:
+                print(f"❌ FAIL: {failure}")
+            return False
+
         print("✅ PASS: QB test successful")
         return True
 
     except Exception as e:
         print(f"❌ FAIL: Exception occurred: {e!s}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -161,7 +184,7 @@ def test_running_back():
     print("\n=== Testing RB: Christian McCaffrey ===")
     try:
         result = get_player_profile(
-            supabase=supabase,
+            supabase=get_supabase_client(),
             player_names=["Christian McCaffrey"],
             season_list=[2023, 2024],
             limit=25,
@@ -178,22 +201,23 @@ def test_running_back():
                 print(f"❌ FAIL: Missing key '{key}' in response")
                 return False
 
-        # Verify player info is populated
-        if not result["playerInfo"]:
-            print("❌ FAIL: playerInfo is empty")
-            return False
+        # Remaining checks are collected so one run reports every failure
+        failures: list[str] = []
 
-        player = result["playerInfo"][0]
-        print(f"  ✓ Player: {player.get('display_name')}")
-        print(f"  ✓ Position: {player.get('position')}")
-        print(f"  ✓ Team: {player.get('latest_team')}")
+        # Verify player info is populated
+        if result["playerInfo"]:
+            player = result["playerInfo"][0]
+            print(f"  ✓ Player: {player.get('display_name')}")
+            print(f"  ✓ Position: {player.get('position')}")
+            print(f"  ✓ Team: {player.get('latest_team')}")
+        else:
+            failures.append("playerInfo is empty")
 
         # Verify rushing stats are populated (RB should have rushing stats)
         if result["rushingStats"]:
             print(f"  ✓ Rushing stats: {len(result['rushingStats'])} records")
         else:
-            print("  ❌ FAIL: No rushing stats found (unexpected for RB)")
-            return False
+            failures.append("No rushing stats found (unexpected for RB)")
 
         # RBs often have receiving stats
         if result["receivingStats"]:
@@ -204,13 +228,16 @@ def test_running_back():
         # Passing stats should be empty for RB
         print(f"  ✓ Passing stats: {len(result['passingStats'])} records (expected 0 for RB)")
 
+        if failures:
+            for failure in failures:
+                print(f"❌ FAIL: {failure}")
+            return False
+
         print("✅ PASS: RB test successful")
         return True
 
     except Exception as e:
         print(f"❌ FAIL: Exception occurred: {e!s}")
-        import traceback
-
         traceback.print_exc()
         return False
 
@@ -221,6 +248,11 @@ def main():
     print("TESTING get_player_profile FUNCTION")
     print("=" * 60)
 
+    # Every scenario needs a live database; skip before any client is created
+    if not SUPABASE_URL or not SUPABASE_ANON_KEY:
+        print("SKIPPED: SUPABASE_URL and SUPABASE_ANON_KEY must be set")
+        sys.exit(0)
+
     results = {
         "Wide Receiver (Justin Jefferson)": test_wide_receiver(),
         "Quarterback (Patrick Mahomes)": test_quarterback(),
@@ -11,6 +11,7 @@ All should properly populate owner_name annotations using League.map_users_to_te
 """
 
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from tools.fantasy.info import (
     get_sleeper_league_matchups,
@@ -23,11 +24,11 @@ TEST_LEAGUE_ID = "1225572389929099264"
 TEST_WEEK = 1
 
 
-def test_rosters():
+def check_rosters(pending: Future):
     """Test get_sleeper_league_rosters returns owner_name annotations."""
     print("\n=== Testing get_sleeper_league_rosters ===")
     try:
-        rosters = get_sleeper_league_rosters(TEST_LEAGUE_ID, summary=False)
+        rosters = pending.result()
 
         if not rosters:
             print("❌ FAIL: No rosters returned")
@@ -54,11 +55,11 @@ def test_rosters():
         return False
 
 
-def test_matchups():
+def check_matchups(pending: Future):
     """Test get_sleeper_league_matchups returns owner_name annotations."""
     print("\n=== Testing get_sleeper_league_matchups ===")
     try:
-        matchups = get_sleeper_league_matchups(TEST_LEAGUE_ID, TEST_WEEK, summary=False)
+        matchups = pending.result()
 
         if not matchups:
             print("❌ FAIL: No matchups returned")
@@ -86,11 +87,11 @@ def test_matchups():
         return False
 
 
-def test_transactions():
+def check_transactions(pending: Future):
     """Test get_sleeper_league_transactions returns owner_name annotations."""
     print("\n=== Testing get_sleeper_league_transactions ===")
     try:
-        transactions = get_sleeper_league_transactions(TEST_LEAGUE_ID, TEST_WEEK)
+        transactions = pending.result()
 
         if not transactions:
             print("⚠️  WARNING: No transactions returned (this is OK if no transactions in week 1)")
@@ -135,11 +136,17 @@ def main():
     print(f"Test League ID: {TEST_LEAGUE_ID}")
     print(f"Test Week: {TEST_WEEK}")
 
-    results = {
-        "rosters": test_rosters(),
-        "matchups": test_matchups(),
-        "transactions": test_transactions(),
-    }
+    # The three fetches are independent, so start them together and validate
+    # in order as each result is needed; output stays sequential.
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        rosters = executor.submit(get_sleeper_league_rosters, TEST_LEAGUE_ID, summary=False)
+        matchups = executor.submit(get_sleeper_league_matchups, TEST_LEAGUE_ID, TEST_WEEK, summary=False)
+        transactions = executor.submit(get_sleeper_league_transactions, TEST_LEAGUE_ID, TEST_WEEK)
+        results = {
+            "rosters": check_rosters(rosters),
+            "matchups": check_matchups(matchups),
+            "transactions": check_transactions(transactions),
+        }
 
     print("\n" + "=" * 60)
     print("SUMMARY")
@@ -7,6 +7,7 @@ Tests execution time to verify ~3x improvement (600ms -> ~200ms) from parallel A
 import statistics
 import sys
 import timeit
+import traceback
 
 # Test league ID from spec
 TEST_LEAGUE_ID = "1225572389929099264"
@@ -162,8 +163,6 @@ def main():
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ ERROR: Performance test failed with exception: {e!s}")
-        import traceback
-
         traceback.print_exc()
         sys.exit(1)
 
@@ -1,8 +1,9 @@
 """
 Integration test for web search tool.
-This script verifies the search_web function works correctly with Tavily API.
+This script verifies the search_web and search_web_batch functions work correctly with Tavily API.
 """
 
+import functools
 import os
 import sys
 
@@ -11,10 +12,23 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from tools.websearch.info import search_web_batch  # noqa: E402
 
-from tools.websearch.info import search_web  # noqa: E402
+BASIC_QUERY = "Patrick Mahomes latest news NFL 2026"
+INJURY_QUERY = "Christian McCaffrey CMC injury status 2026"
+
+# max_results each scenario checks
+SCENARIO_MAX_RESULTS = {BASIC_QUERY: 3, INJURY_QUERY: 5}
+
+
+@functools.lru_cache(maxsize=1)
+def _search_results():
+    """Run the search scenarios in concurrent batches (one per max_results), keyed by query."""
+    results = {}
+    for max_results in sorted(set(SCENARIO_MAX_RESULTS.values())):
+        queries = [q for q, n in SCENARIO_MAX_RESULTS.items() if n == max_results]
+        results.update(zip(queries, search_web_batch(queries, max_results=max_results), strict=True))
+    return results
 
 
 def test_web_search_basic():
@@ -23,10 +37,10 @@ def test_web_search_basic():
     print("TEST 1: Basic Web Search - Patrick Mahomes News")
     print("=" * 60)
 
-    query = "Patrick Mahomes latest news NFL 2026"
+    query = BASIC_QUERY
     print(f"\nQuery: {query}")
 
-    result = search_web(query, max_results=3)
+    result = _search_results()[query]
 
     if "error" in result:
         print(f"\n❌ FAILED: {result['error']}")
@@ -58,10 +72,10 @@ def test_web_search_injury():
     print("TEST 2: Injury Status Search - Christian McCaffrey")
     print("=" * 60)
 
-    query = "Christian McCaffrey CMC injury status 2026"
+    query = INJURY_QUERY
     print(f"\nQuery: {query}")
 
-    result = search_web(query, max_results=5)
+    result = _search_results()[query]
 
     if "error" in result:
         print(f"\n❌ FAILED: {result['error']}")
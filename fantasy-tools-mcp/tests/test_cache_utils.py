@@ -0,0 +1,83 @@
+"""
+Tests for the per-player TTL + LRU cache used by composite tools.
+
+Verifies:
+1. Only uncached names are passed to the fetch function
+2. Spelling variants of one player share a cache entry
+3. Expired entries are refetched and the size bound evicts least-recently used
+4. Fetch errors propagate and nothing is cached
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from helpers import cache_utils
+from helpers.cache_utils import TTLCache
+
+
+def _fetch_recorder(calls: list):
+    def fetch(names):
+        calls.append(list(names))
+        return {n: f"row:{n}" for n in names}
+
+    return fetch
+
+
+def test_fetches_only_misses():
+    """A second call fetches just the names not served from cache."""
+    cache = TTLCache()
+    calls: list = []
+    fetch = _fetch_recorder(calls)
+
+    cache.get_or_fetch_many(["Puka Nacua"], fetch)
+    result = cache.get_or_fetch_many(["Puka Nacua", "CeeDee Lamb"], fetch)
+
+    assert calls == [["Puka Nacua"], ["CeeDee Lamb"]]
+    assert result == {"Puka Nacua": "row:Puka Nacua", "CeeDee Lamb": "row:CeeDee Lamb"}
+
+
+def test_spelling_variants_share_entry():
+    """Case/punctuation variants hit the entry stored for the first spelling."""
+    cache = TTLCache()
+    calls: list = []
+    fetch = _fetch_recorder(calls)
+
+    cache.get_or_fetch_many(["Amon-Ra St. Brown"], fetch)
+    result = cache.get_or_fetch_many(["amon-ra st brown"], fetch)
+
+    assert len(calls) == 1
+    assert result == {"amon-ra st brown": "row:Amon-Ra St. Brown"}
+
+
+def test_expiry_and_lru_eviction():
+    """Entries past the TTL are refetched; the oldest entry is evicted at maxsize."""
+    cache = TTLCache(maxsize=2, ttl=120)
+    calls: list = []
+    fetch = _fetch_recorder(calls)
+
+    cache.get_or_fetch_many(["A Player", "B Player"], fetch)
+    cache.get_or_fetch_many(["A Player"], fetch)  # refresh A's recency
+    cache.get_or_fetch_many(["C Player"], fetch)  # evicts B
+    cache.get_or_fetch_many(["A Player", "B Player"], fetch)
+    assert calls[-1] == ["B Player"]
+
+    later = cache_utils.time.monotonic() + 121
+    with patch.object(cache_utils.time, "monotonic", return_value=later):
+        cache.get_or_fetch_many(["C Player"], fetch)
+    assert calls[-1] == ["C Player"]
+
+
+def test_fetch_error_is_not_cached():
+    """Errors propagate to the caller and the name is fetched again next time."""
+    cache = TTLCache()
+
+    def failing(names):
+        raise RuntimeError("supabase down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch_many(["Bijan Robinson"], failing)
+
+    calls: list = []
+    cache.get_or_fetch_many(["Bijan Robinson"], _fetch_recorder(calls))
+    assert calls == [["Bijan Robinson"]]
@@ -0,0 +1,36 @@
+"""
+Tests for splitting batched multi-player query results back per name.
+
+Verifies:
+1. Rows are bucketed by the same substring match the ILIKE filter uses
+2. per_name_limit keeps only the first (most recent) rows per name
+3. Names with no matching rows map to an empty list
+"""
+
+from helpers.query_utils import group_rows_by_name
+
+ROWS = [
+    {"season": 2024, "merge_name": "justin jefferson"},
+    {"season": 2024, "merge_name": "puka nacua"},
+    {"season": 2023, "merge_name": "justin jefferson"},
+    {"season": 2022, "merge_name": "justin jefferson"},
+]
+
+
+def test_groups_rows_by_sanitized_substring():
+    """Each input name receives the rows whose merge_name contains it."""
+    grouped = group_rows_by_name(ROWS, ["Justin Jefferson", "Puka Nacua"], ["merge_name"])
+    assert [r["season"] for r in grouped["Justin Jefferson"]] == [2024, 2023, 2022]
+    assert grouped["Puka Nacua"] == [ROWS[1]]
+
+
+def test_per_name_limit_keeps_first_rows():
+    """Only the first per_name_limit rows (in query order) are kept per name."""
+    grouped = group_rows_by_name(ROWS, ["Jefferson"], ["merge_name"], per_name_limit=2)
+    assert [r["season"] for r in grouped["Jefferson"]] == [2024, 2023]
+
+
+def test_unmatched_name_maps_to_empty_list():
+    """Names without rows are still present in the result."""
+    grouped = group_rows_by_name(ROWS, ["Bijan Robinson"], ["merge_name"])
+    assert grouped == {"Bijan Robinson": []}
@@ -0,0 +1,33 @@
+"""
+Tests for batched player info lookups used by start/sit and trade.
+
+Verifies:
+1. get_player_info scales its row limit with the number of names
+2. match_player_info raises on a get_player_info error row instead of reporting everyone not found
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from tools.player import info
+
+
+def test_row_limit_scales_with_names():
+    """Each requested name gets its own row budget so common surnames can't crowd others out."""
+    mock_sb = MagicMock()
+    query = mock_sb.table.return_value.select.return_value.or_.return_value
+    query.limit.return_value.execute.return_value.data = []
+
+    info.get_player_info(mock_sb, ["Justin Jefferson", "Van Jefferson", "Ja'Marr Chase"])
+
+    query.limit.assert_called_once_with(35 * 3)
+
+
+def test_error_row_is_raised():
+    """An error row (e.g. too many names) surfaces as ValueError."""
+    names = [f"Player {i}" for i in range(info._MAX_LOOKUP_NAMES + 1)]
+    rows = info.get_player_info(MagicMock(), names)
+
+    with pytest.raises(ValueError, match="Too many player names"):
+        info.match_player_info(rows, names)
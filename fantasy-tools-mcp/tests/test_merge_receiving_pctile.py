@@ -0,0 +1,22 @@
+"""
+Tests for merging receiving percentile ranks into start/sit season rows.
+
+Verifies:
+1. Percentile columns land on the matching season's row
+2. The original (possibly cached) receiving rows are left untouched
+"""
+
+from tools.startsit import info
+
+
+def test_merge_does_not_mutate_source_rows():
+    """Merged rows are new dicts; the rows shared with the season card cache keep their keys."""
+    cached_row = {"season": 2024, "targets": 120}
+    receiving = {"Justin Jefferson": [cached_row]}
+    recv_pctile = {"Justin Jefferson": [{"season": 2024, "merge_name": "justin jefferson", "targets_pctile": 0.97}]}
+
+    merged = info._merge_receiving_pctile(receiving, recv_pctile)
+
+    assert merged == {"Justin Jefferson"}
+    assert receiving["Justin Jefferson"] == [{"season": 2024, "targets": 120, "targets_pctile": 0.97}]
+    assert cached_row == {"season": 2024, "targets": 120}
@@ -0,0 +1,75 @@
+"""
+Contract tests for the advanced metrics wrappers in tools.metrics.info.
+
+Each wrapper only forwards table-specific parameters to build_player_stats_query,
+so these tests patch the helper and check what it receives; no Supabase calls.
+
+Verifies:
+1. Seasonal passing stats target the seasonal view with QB defaults
+2. Weekly rushing stats target the weekly view and forward weekly_list
+"""
+
+from unittest.mock import MagicMock, patch
+
+from tools.metrics import info
+
+PASSING_SEASON_KWARGS = {
+    "table_name": "vw_advanced_passing_analytics",
+    "base_columns": ["season", "player_name", "ff_team", "ff_position"],
+    "player_name_column": "merge_name",
+    "position_column": "ff_position",
+    "default_positions": ["QB"],
+    "return_key": "advPassingStats",
+}
+
+RUSHING_WEEKLY_KWARGS = {
+    "table_name": "vw_advanced_rushing_analytics_weekly",
+    "base_columns": ["season", "week", "player_name", "team", "position"],
+    "player_name_column": "merge_name",
+    "position_column": "position",
+    "default_positions": ["RB", "QB"],
+    "return_key": "advRushingStats",
+}
+
+
+def test_passing_stats_wiring():
+    """Seasonal passing forwards its view, columns and caller arguments unchanged."""
+    mock_sb = MagicMock()
+    with patch.object(info, "build_player_stats_query", return_value={"advPassingStats": []}) as mock_build:
+        info.get_advanced_passing_stats(
+            mock_sb, player_names=["Patrick Mahomes"], season_list=[2024], metrics=["passing_yards"], limit=3
+        )
+
+    mock_build.assert_called_once_with(
+        supabase=mock_sb,
+        **PASSING_SEASON_KWARGS,
+        player_names=["Patrick Mahomes"],
+        season_list=[2024],
+        weekly_list=None,
+        metrics=["passing_yards"],
+        order_by_metric=None,
+        limit=3,
+        positions=None,
+        exact_names=None,
+    )
+
+
+def test_rushing_weekly_wiring():
+    """Weekly rushing forwards weekly_list and ordering to the weekly view."""
+    mock_sb = MagicMock()
+    with patch.object(info, "build_player_stats_query", return_value={"advRushingStats": []}) as mock_build:
+        info.get_advanced_rushing_stats_weekly(
+            mock_sb, season_list=[2024], weekly_list=[1, 2, 3], order_by_metric="rushing_yards", limit=3
+        )
+
+    mock_build.assert_called_once_with(
+        supabase=mock_sb,
+        **RUSHING_WEEKLY_KWARGS,
+        player_names=None,
+        season_list=[2024],
+        weekly_list=[1, 2, 3],
+        metrics=None,
+        order_by_metric="rushing_yards",
+        limit=3,
+        positions=None,
+    )
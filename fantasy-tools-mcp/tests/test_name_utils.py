@@ -0,0 +1,34 @@
+"""
+Tests for player name normalization helpers.
+
+Verifies:
+1. sanitize_name strips suffixes, punctuation, and extra whitespace
+2. dedupe_names collapses case/whitespace variants of the same player
+3. dedupe_names preserves first-seen order
+"""
+
+from helpers.name_utils import dedupe_names, sanitize_name
+
+
+def test_sanitize_name_strips_suffix_and_punctuation():
+    """Suffixes and punctuation are removed and the result is lowercased."""
+    assert sanitize_name("Marvin Harrison Jr.") == "marvin harrison"
+    assert sanitize_name("Ja'Marr  Chase") == "jamarr chase"
+
+
+def test_dedupe_names_collapses_variants():
+    """Case and whitespace variants of one player produce a single entry."""
+    result = dedupe_names(["Justin Jefferson", "justin jefferson", "Justin  Jefferson"])
+    assert result == ["justin jefferson"]
+
+
+def test_dedupe_names_preserves_order():
+    """Distinct names keep the order they were first seen in."""
+    result = dedupe_names(["Puka Nacua", "CeeDee Lamb", "puka nacua", "Amon-Ra St. Brown"])
+    assert result == ["puka nacua", "ceedee lamb", "amon-ra st brown"]
+
+
+def test_dedupe_names_drops_empty_after_sanitization():
+    """Whitespace/punctuation-only names are dropped so no %% pattern is emitted."""
+    assert dedupe_names(["   ", "...", "", "Jr."]) == []
+    assert dedupe_names(["  ", "Bijan Robinson"]) == ["bijan robinson"]
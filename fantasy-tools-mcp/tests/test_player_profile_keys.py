@@ -0,0 +1,51 @@
+"""
+Tests for how get_player_profile keys its stats queries.
+
+Verifies:
+1. When every name resolves to one player, stats match by exact merge_name keys
+2. A batch mixing resolved and unresolved names keeps the ILIKE name search for all
+   categories, so the unresolved name still finds its stats
+"""
+
+from unittest.mock import MagicMock, patch
+
+from tools.player import info
+
+JEFFERSON = {"display_name": "Justin Jefferson", "merge_name": "justin jefferson", "position": "WR"}
+MAHOMES = {"display_name": "Patrick Mahomes", "merge_name": "patrick mahomes", "position": "QB"}
+
+
+def _mock_categories():
+    return tuple(
+        (key, MagicMock(return_value={return_key: []}), return_key, positions)
+        for key, _, return_key, positions in info._PROFILE_STAT_CATEGORIES
+    )
+
+
+def test_all_resolved_uses_exact_keys():
+    """Two uniquely resolved names query only their positions' views, by merge_name."""
+    categories = _mock_categories()
+    with (
+        patch.object(info, "get_player_info", return_value=[JEFFERSON, MAHOMES]),
+        patch.object(info, "_PROFILE_STAT_CATEGORIES", categories),
+    ):
+        info.get_player_profile(MagicMock(), ["Justin Jefferson", "Patrick Mahomes"])
+
+    for _, fetch, _, _ in categories:
+        fetch.assert_called_once()
+        assert fetch.call_args.kwargs["merge_names"] == ["justin jefferson", "patrick mahomes"]
+
+
+def test_mixed_batch_falls_back_to_ilike():
+    """An unresolved name disables exact keys and position gating so its stats are still found."""
+    categories = _mock_categories()
+    with (
+        patch.object(info, "get_player_info", return_value=[JEFFERSON]),
+        patch.object(info, "_PROFILE_STAT_CATEGORIES", categories),
+    ):
+        info.get_player_profile(MagicMock(), ["Justin Jefferson", "Bijan Robinson"])
+
+    for _, fetch, _, _ in categories:
+        fetch.assert_called_once()
+        assert fetch.call_args.kwargs["merge_names"] is None
+        assert fetch.call_args.kwargs["player_names"] == ["Justin Jefferson", "Bijan Robinson"]
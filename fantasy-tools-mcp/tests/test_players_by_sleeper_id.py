@@ -0,0 +1,32 @@
+"""
+Tests for get_players_by_sleeper_id batching.
+
+Verifies:
+1. Full rosters (more IDs than one lookup allows) are split into bounded batches
+2. Batch results are concatenated in order instead of returning an error row
+"""
+
+from unittest.mock import MagicMock
+
+from tools.player import info
+
+
+def test_full_roster_is_batched():
+    """60 IDs become three OR lookups of at most _MAX_LOOKUP_NAMES, with all rows returned."""
+    ids = [str(1000 + i) for i in range(60)]
+    mock_sb = MagicMock()
+    mock_or = mock_sb.table.return_value.select.return_value.or_
+
+    def respond_or(or_filter):
+        batch = [part.split(".eq.")[1] for part in or_filter.split(",")]
+        query = MagicMock()
+        query.limit.return_value.execute.return_value.data = [{"sleeper_id": int(sid)} for sid in batch]
+        return query
+
+    mock_or.side_effect = respond_or
+
+    result = info.get_players_by_sleeper_id(mock_sb, ids)
+
+    batch_sizes = [len(c.args[0].split(",")) for c in mock_or.call_args_list]
+    assert batch_sizes == [25, 25, 10]
+    assert [str(r["sleeper_id"]) for r in result] == ids
@@ -0,0 +1,63 @@
+"""
+Tests for query_rows_per_name and the per-player weekly trend fetch.
+
+Verifies:
+1. A batch that comes back full re-queries players it cut short
+2. A batch under its limit is trusted as-is (no extra queries)
+3. Trade weekly trend queries each player alone, most recent weeks first
+"""
+
+from unittest.mock import MagicMock, patch
+
+from helpers import query_utils
+from tools.trade import info as trade_info
+
+QUERY_KWARGS = {
+    "table_name": "mv_player_consistency",
+    "base_columns": ["merge_name", "season"],
+    "player_name_column": "merge_name",
+    "position_column": "ff_position",
+    "default_positions": ["QB", "RB", "WR", "TE"],
+    "return_key": "consistency",
+}
+
+
+def test_full_batch_requeries_crowded_player():
+    """A player crowded out of a full batch (older latest season) is fetched on its own."""
+    crowded_batch = {"consistency": [{"merge_name": "justin jefferson", "season": s} for s in (2024, 2023, 2022, 2021)]}
+    single = {"consistency": [{"merge_name": "michael thomas", "season": 2022}]}
+    with patch.object(query_utils, "build_player_stats_query", side_effect=[crowded_batch, single]) as mock_build:
+        result = query_utils.query_rows_per_name(
+            MagicMock(), ["Justin Jefferson", "Michael Thomas"], ["merge_name"], 1, **QUERY_KWARGS
+        )
+
+    assert mock_build.call_count == 2
+    assert mock_build.call_args.kwargs["player_names"] == ["Michael Thomas"]
+    assert mock_build.call_args.kwargs["limit"] == 2
+    assert [r["season"] for r in result["Justin Jefferson"]] == [2024]
+    assert result["Michael Thomas"] == single["consistency"]
+
+
+def test_partial_batch_is_not_requeried():
+    """Under the limit every matching row was returned, so short players really have no more rows."""
+    batch = {"consistency": [{"merge_name": "justin jefferson", "season": 2024}]}
+    with patch.object(query_utils, "build_player_stats_query", return_value=batch) as mock_build:
+        result = query_utils.query_rows_per_name(
+            MagicMock(), ["Justin Jefferson", "Michael Thomas"], ["merge_name"], 1, **QUERY_KWARGS
+        )
+
+    mock_build.assert_called_once()
+    assert mock_build.call_args.kwargs["limit"] == 4
+    assert result == {"Justin Jefferson": batch["consistency"], "Michael Thomas": []}
+
+
+def test_weekly_trend_is_per_player_and_week_ordered():
+    """Each player's trend is its own query ordered season DESC, week DESC."""
+    with patch.object(trade_info, "build_player_stats_query", return_value={"weeklyTrend": []}) as mock_build:
+        trade_info._fetch_weekly_trend(MagicMock(), "Justin Jefferson", 4)
+
+    kwargs = mock_build.call_args.kwargs
+    assert kwargs["player_names"] == ["Justin Jefferson"]
+    assert kwargs["limit"] == 4
+    assert kwargs["player_sort_column"] == "week"
+    assert kwargs["player_sort_desc"] is True
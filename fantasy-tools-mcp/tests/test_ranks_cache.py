@@ -0,0 +1,74 @@
+"""
+Tests for the process-local dynasty rankings TTL cache.
+
+Verifies:
+1. Consecutive calls (e.g. start/sit then trade) share one Supabase fetch
+2. The by-name lookup is served from the same cached fetch
+3. Stale entries are refetched after the TTL expires
+4. Cached rows keep every rank column (compare_players returns them whole)
+"""
+
+from unittest.mock import MagicMock, patch
+
+from tools.ranks import cache
+
+RANKS = [
+    {"player": "Justin Jefferson", "pos": "WR", "ecr": 1.0},
+    {"player": "Bijan Robinson", "pos": "RB", "ecr": 2.0},
+]
+
+
+def _clear_cache():
+    """Clear the module-level cache between tests."""
+    with cache._ranks_cache_lock:
+        cache._ranks_cache.clear()
+
+
+def test_chained_calls_share_one_fetch():
+    """A second tool call within the TTL reuses the first call's rankings."""
+    _clear_cache()
+    mock_sb = MagicMock()
+    with patch.object(cache, "get_fantasy_ranks", return_value=RANKS) as fetch:
+        first = cache.get_cached_fantasy_ranks(mock_sb)
+        by_name = cache.get_cached_rankings_by_name(mock_sb)
+
+    assert first == RANKS
+    assert by_name["bijan robinson"]["ecr"] == 2.0
+    fetch.assert_called_once_with(supabase=mock_sb, limit=500, fields=cache._CACHED_RANK_FIELDS)
+
+
+def test_stale_entry_is_refetched():
+    """Entries older than the TTL trigger a new fetch."""
+    _clear_cache()
+    mock_sb = MagicMock()
+    with patch.object(cache, "get_fantasy_ranks", return_value=RANKS) as fetch:
+        cache.get_cached_fantasy_ranks(mock_sb)
+        with patch.object(cache.time, "monotonic", return_value=cache.time.monotonic() + cache._RANKS_TTL + 1):
+            cache.get_cached_fantasy_ranks(mock_sb)
+
+    assert fetch.call_count == 2
+
+
+def test_cached_rows_keep_all_rank_columns():
+    """The cache selects every rank column, so compare_players' ranking rows stay complete."""
+    _clear_cache()
+    full_keys = {
+        "player",
+        "team",
+        "pos",
+        "ecr",
+        "age",
+        "years_of_experience",
+        "team_nfl",
+        "team_full",
+        "player_owned_avg",
+    }
+    row = dict.fromkeys(full_keys, None) | {"player": "Justin Jefferson", "ecr": 1.0}
+    mock_sb = MagicMock()
+    select = mock_sb.table.return_value.select
+    select.return_value.order.return_value.limit.return_value.execute.return_value.data = [row]
+
+    ranking = cache.get_cached_rankings_by_name(mock_sb)["justin jefferson"]
+
+    assert set(select.call_args.args[0].split(",")) == full_keys
+    assert set(ranking) == full_keys
@@ -126,11 +126,7 @@ def test_batching():
     # 250 IDs should produce 3 batches: 100, 100, 50
     all_ids = [str(i) for i in range(1, 251)]
 
-    # Track in_() calls to verify batching
-    call_batches = []
-
-    def capture_in(column, ids):
-        call_batches.append(ids)
+    def respond_in(column, ids):
         response = MagicMock()
         response.data = [
             {"sleeper_id": pid, "display_name": f"Player {pid}", "latest_team": "TST", "position": "WR"} for pid in ids
@@ -140,9 +136,12 @@ def test_batching():
         return execute_mock
 
     mock_sb = MagicMock()
-    mock_sb.table.return_value.select.return_value.in_ = capture_in
+    mock_in = mock_sb.table.return_value.select.return_value.in_
+    mock_in.side_effect = respond_in
 
     result = _resolve_player_ids(mock_sb, all_ids)
+    # in_(column, ids) calls, in order, to verify batching
+    call_batches = [c.args[1] for c in mock_in.call_args_list]
 
     assert len(result) == 250, f"Expected 250 results, got {len(result)}"
 
@@ -15,6 +15,7 @@ import sys
 import time
 from unittest.mock import Mock, patch
 
+import httpx
 import requests
 
 # Add parent directory to path so we can import from fantasy-tools-mcp root
@@ -197,6 +198,17 @@ def test_helper_functions():
     assert not is_retryable_http_error(error_404), "404 should not be retryable"
     print("  ✓ 404 errors are not retryable")
 
+    # httpx (supabase-py transport) errors follow the same rules
+    request = httpx.Request("GET", "https://example.supabase.co/rest/v1/players")
+    assert is_retryable_http_error(httpx.ConnectTimeout("timed out", request=request)), "httpx timeout should retry"
+    assert is_retryable_http_error(
+        httpx.HTTPStatusError("503", request=request, response=httpx.Response(503, request=request))
+    ), "httpx 5xx should be retryable"
+    assert not is_retryable_http_error(
+        httpx.HTTPStatusError("400", request=request, response=httpx.Response(400, request=request))
+    ), "httpx 4xx should not be retryable"
+    print("  ✓ httpx transport and 5xx errors are retryable, 4xx are not")
+
     print("\n✅ TEST 4 PASSED: Helper functions working correctly")
     return True
 
@@ -207,11 +219,12 @@ def test_integration_with_base_api():
     print("TEST 5: Integration with BaseApi Class")
     print("=" * 70)
 
+    from tools.fantasy.sleeper_wrapper import base_api
     from tools.fantasy.sleeper_wrapper.base_api import BaseApi
 
     api = BaseApi()
 
-    # Mock requests.get to simulate failure
+    # Mock the shared session's get to simulate failure
     call_count = 0
 
     def mock_get(url):
@@ -222,7 +235,7 @@ def test_integration_with_base_api():
         # Simulate connection error
         raise requests.exceptions.ConnectionError("Simulated connection error")
 
-    with patch("requests.get", side_effect=mock_get):
+    with patch.object(base_api._SESSION, "get", side_effect=mock_get):
         try:
             api._call("https://api.sleeper.app/v1/user/test")
         except requests.exceptions.ConnectionError:
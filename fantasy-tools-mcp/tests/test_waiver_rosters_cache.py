@@ -0,0 +1,52 @@
+"""
+Tests for the waiver tool's league rosters TTL cache.
+
+Verifies:
+1. Back-to-back calls for one league share a single Sleeper fetch
+2. Failed fetches are not cached
+3. clear_waiver_cache forces a refetch
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tools.waiver import info
+
+ROSTERS = [{"roster_id": 1, "players": ["4046", "6794"]}]
+
+
+def test_back_to_back_calls_share_one_fetch():
+    """A second waiver call for the same league within the TTL reuses the rosters."""
+    info.clear_waiver_cache()
+    mock_sb = MagicMock()
+    with patch.object(info, "get_sleeper_league_rosters", return_value=ROSTERS) as fetch:
+        first = info._get_cached_rosters(mock_sb, "123")
+        second = info._get_cached_rosters(mock_sb, "123")
+
+    assert first == second == ROSTERS
+    fetch.assert_called_once_with("123", summary=False, supabase=mock_sb)
+
+
+def test_failed_fetch_is_not_cached():
+    """An exception propagates and the next call fetches again."""
+    info.clear_waiver_cache()
+    mock_sb = MagicMock()
+    with patch.object(info, "get_sleeper_league_rosters", side_effect=[Exception("boom"), ROSTERS]) as fetch:
+        with pytest.raises(Exception, match="boom"):
+            info._get_cached_rosters(mock_sb, "123")
+        assert info._get_cached_rosters(mock_sb, "123") == ROSTERS
+
+    assert fetch.call_count == 2
+
+
+def test_clear_forces_refetch():
+    """clear_waiver_cache drops cached rosters."""
+    info.clear_waiver_cache()
+    mock_sb = MagicMock()
+    with patch.object(info, "get_sleeper_league_rosters", return_value=ROSTERS) as fetch:
+        info._get_cached_rosters(mock_sb, "123")
+        info.clear_waiver_cache()
+        info._get_cached_rosters(mock_sb, "123")
+
+    assert fetch.call_count == 2
@@ -18,7 +18,7 @@ from tools.metrics.info import (
     get_advanced_rushing_stats,
 )
 from tools.player.info import get_player_info
-from tools.ranks.info import get_fantasy_ranks
+from tools.ranks.cache import get_cached_rankings_by_name
 
 # Position-appropriate metrics (043)
 # Receiving pctile columns live in mv_receiving_percentile_ranks (separate MV)
@@ -47,6 +47,7 @@ _RECEIVING_PCTILE_COLS = [
     "catch_percentage_pctile",
     "avg_yac_pctile",
 ]
+_RECEIVING_PCTILE_SET = frozenset(_RECEIVING_PCTILE_COLS)
 
 _PASSING_METRICS = [
     "passing_yards",
@@ -84,6 +85,15 @@ _RUSHING_METRICS = [
     "avg_rush_yards_pctile",
 ]
 
+# Every pctile column any stats category can carry; validation checks rows against this set
+_ALL_PCTILE = frozenset(
+    [
+        *_RECEIVING_PCTILE_COLS,
+        *(c for c in _PASSING_METRICS if c.endswith("_pctile")),
+        *(c for c in _RUSHING_METRICS if c.endswith("_pctile")),
+    ]
+)
+
 
 def get_player_deep_dive(
     supabase: Client,
@@ -119,6 +129,8 @@ def get_player_deep_dive(
             - usage_trends: Target share and snap count weekly trends
             - scoring_format: Scoring format string
             - data_season: Most recent season in the data
+            - missing_required_data: {player_name, reason} entries for missing consistency
+              ("consistency_unavailable") or percentile ranks ("percentile_ranks_unavailable"), or None
     """
     if not player_name or not player_name.strip():
         raise ValueError("player_name is required")
@@ -211,11 +223,11 @@ def get_player_deep_dive(
         except Exception:
             return []
 
-    def _fetch_dynasty_ranks() -> list[dict]:
+    def _fetch_dynasty_ranks() -> dict[str, dict]:
         try:
-            return get_fantasy_ranks(supabase=supabase, limit=500)
+            return get_cached_rankings_by_name(supabase)
         except Exception:
-            return []
+            return {}
 
     def _fetch_game_log() -> list[dict]:
         if not include_game_log:
@@ -278,7 +290,7 @@ def get_player_deep_dive(
         pass_data = pass_future.result()
         rush_data = rush_future.result()
         consistency_data = consistency_future.result()
-        all_rankings = rankings_future.result()
+        rankings_by_name = rankings_future.result()
         game_log = game_log_future.result()
         usage_trends = usage_future.result()
 
@@ -288,9 +300,7 @@ def get_player_deep_dive(
         for row in recv_data:
             pctile = pctile_by_season.get(row.get("season"))
             if pctile:
-                for col in _RECEIVING_PCTILE_COLS:
-                    if col in pctile:
-                        row[col] = pctile[col]
+                row.update({k: v for k, v in pctile.items() if k in _RECEIVING_PCTILE_SET})
 
     # --- Build player info ---
     player_info = info_list[0] if info_list else None
@@ -320,18 +330,11 @@ def get_player_deep_dive(
     ]:
         if stat_data:
             season_stats[label] = stat_data
-            for row in stat_data:
-                s = row.get("season")
-                if s and (data_season is None or s > data_season):
-                    data_season = s
+            seasons = [row["season"] for row in stat_data if row.get("season")]
+            if seasons:
+                data_season = max(data_season or 0, max(seasons))
 
     # --- Build dynasty ranking ---
-    rankings_by_name: dict[str, dict] = {}
-    for entry in all_rankings:
-        pname = entry.get("player", "").lower()
-        if pname:
-            rankings_by_name[pname] = entry
-
     rank_data = rankings_by_name.get(name.lower()) or rankings_by_name.get(display_name.lower())
     dynasty_ranking = None
     if rank_data:
@@ -342,14 +345,14 @@ def get_player_deep_dive(
         }
 
     # --- Validate required fields (percentile ranks + consistency) ---
-    missing_required: list[str] = []
+    missing_required: list[dict] = []
     if consistency_data is None:
-        missing_required.append(f"{display_name}: consistency metrics unavailable")
+        missing_required.append({"player_name": display_name, "reason": "consistency_unavailable"})
     has_pctile = any(
-        any(k.endswith("_pctile") for k in row) for cat in season_stats.values() if isinstance(cat, list) for row in cat
+        not _ALL_PCTILE.isdisjoint(row) for cat in season_stats.values() if isinstance(cat, list) for row in cat
     )
     if season_stats and not has_pctile:
-        missing_required.append(f"{display_name}: positional percentile ranks unavailable")
+        missing_required.append({"player_name": display_name, "reason": "percentile_ranks_unavailable"})
 
     return {
         "player_info": {
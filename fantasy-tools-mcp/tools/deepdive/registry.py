@@ -40,7 +40,9 @@ def register_tools(mcp: FastMCP, supabase: Client):
             "season stats with positional percentile ranks (e.g. target_share_pctile: 95 means "
             "top 5% at position), consistency metrics (avg FP, stddev, floor P10, ceiling P90, "
             "boom/bust counts, consistency coefficient), dynasty ranking (ECR, positional rank), "
-            "weekly game log with fantasy points (if requested), and target share / usage trends.\n\n"
+            "weekly game log with fantasy points (if requested), and target share / usage trends. "
+            "missing_required_data lists {player_name, reason} entries with reason "
+            "'consistency_unavailable' or 'percentile_ranks_unavailable'.\n\n"
             "Keywords: player evaluation, deep dive, breakout, sell-high, buy-low, dynasty value, "
             "keeper, draft prep, player research, scouting report, player profile"
         ),
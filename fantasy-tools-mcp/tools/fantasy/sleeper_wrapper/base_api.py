@@ -1,13 +1,21 @@
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
 
+from helpers.executor_utils import FETCH_POOL_SIZE
 from helpers.retry_utils import async_retry_with_backoff, retry_with_backoff
 
+# One pooled session for every sync Sleeper call, so concurrent tool fetches reuse
+# kept-alive TLS connections instead of opening a new one per request.
+# pool_maxsize matches the shared fetch pool's worker count.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=FETCH_POOL_SIZE))
+
 
 class BaseApi:
     @retry_with_backoff()
     def _call(self, url: str) -> dict:
-        result_json_string = requests.get(url)
+        result_json_string = _SESSION.get(url)
         result_json_string.raise_for_status()
         result = result_json_string.json()
         return result
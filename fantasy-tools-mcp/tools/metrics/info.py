@@ -48,6 +48,7 @@ def get_advanced_receiving_stats(
     order_by_metric: str | None = None,
     limit: int | None = 25,
     positions: list[str] | None = None,
+    merge_names: list[str] | None = None,
 ) -> dict:
     """
     Fetch advanced seasonal receiving stats for NFL players.
@@ -60,6 +61,8 @@ def get_advanced_receiving_stats(
         order_by_metric: optional metric/column to order by (str). If provided, orders by this metric desc.
         limit: optional max rows to return (defaults to 25). Enforced cap applied.
         positions: optional list of positions to filter (ff_position column). Defaults to ["WR","TE","RB"] if not provided.
+        merge_names: optional exact merge_name keys already resolved via get_player_info; replaces
+            the player_names ILIKE match with an indexed IN filter.
 
     Returns:
         dict: Advanced receiving stats data
@@ -79,6 +82,7 @@ def get_advanced_receiving_stats(
         order_by_metric=order_by_metric,
         limit=limit,
         positions=positions,
+        exact_names=merge_names,
     )
 
 
@@ -90,6 +94,7 @@ def get_advanced_passing_stats(
     order_by_metric: str | None = None,
     limit: int | None = 25,
     positions: list[str] | None = None,
+    merge_names: list[str] | None = None,
 ) -> dict:
     """
     Fetch advanced seasonal passing stats for NFL quarterbacks and passers.
@@ -102,6 +107,8 @@ def get_advanced_passing_stats(
         order_by_metric: optional metric/column to order by (DESC)
         limit: optional max rows to return (defaults to 25). Enforced cap applied.
         positions: optional list of positions to filter (ff_position column). Defaults to ["QB"].
+        merge_names: optional exact merge_name keys already resolved via get_player_info; replaces
+            the player_names ILIKE match with an indexed IN filter.
 
     Returns:
         dict: Advanced passing stats data
@@ -121,6 +128,7 @@ def get_advanced_passing_stats(
         order_by_metric=order_by_metric,
         limit=limit,
         positions=positions,
+        exact_names=merge_names,
     )
 
 
@@ -132,6 +140,7 @@ def get_advanced_rushing_stats(
     order_by_metric: str | None = None,
     limit: int | None = 25,
     positions: list[str] | None = None,
+    merge_names: list[str] | None = None,
 ) -> dict:
     """
     Fetch advanced seasonal rushing stats for NFL players.
@@ -144,6 +153,8 @@ def get_advanced_rushing_stats(
         order_by_metric: optional metric/column to order by (DESC)
         limit: optional max rows to return (defaults to 25). Enforced cap applied.
         positions: optional list of positions to filter (ff_position column). Defaults to ["RB","QB"].
+        merge_names: optional exact merge_name keys already resolved via get_player_info; replaces
+            the player_names ILIKE match with an indexed IN filter.
 
     Returns:
         dict: Advanced rushing stats data
@@ -163,6 +174,7 @@ def get_advanced_rushing_stats(
         order_by_metric=order_by_metric,
         limit=limit,
         positions=positions,
+        exact_names=merge_names,
     )
 
 
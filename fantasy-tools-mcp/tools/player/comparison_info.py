@@ -8,7 +8,7 @@ from supabase import Client
 
 from helpers.query_utils import build_player_stats_query
 from tools.player.info import get_player_profile
-from tools.ranks.info import get_fantasy_ranks
+from tools.ranks.cache import get_cached_rankings_by_name
 
 
 def compare_players(
@@ -72,9 +72,9 @@ def compare_players(
 
         def _fetch_dynasty_rankings():
             try:
-                return get_fantasy_ranks(supabase=supabase, limit=500)
+                return get_cached_rankings_by_name(supabase)
             except Exception:
-                return []
+                return {}
 
         def _fetch_consistency(name):
             try:
@@ -113,7 +113,7 @@ def compare_players(
             consistency_futures = [executor.submit(_fetch_consistency, name) for name in player_names]
 
             profiles = [f.result() for f in profile_futures]
-            all_rankings = rankings_future.result()
+            rankings_by_player = rankings_future.result()
             consistency_data = [f.result() for f in consistency_futures]
 
         # Structure the comparison output
@@ -128,13 +128,6 @@ def compare_players(
             "consistency": [],
         }
 
-        # Create rankings lookup by player name
-        rankings_by_player = {}
-        for rank_entry in all_rankings:
-            player_name = rank_entry.get("player", "").lower()
-            if player_name:
-                rankings_by_player[player_name] = rank_entry
-
         # Extract data for each player
         for idx, profile in enumerate(profiles):
             if not profile:
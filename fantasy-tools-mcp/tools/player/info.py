@@ -3,18 +3,50 @@ Player information tools for fantasy football analysis.
 """
 
 from concurrent.futures import ThreadPoolExecutor
+from typing import TypedDict
 
 from supabase import Client
 
-from helpers.name_utils import sanitize_name
+from helpers.name_utils import dedupe_names, sanitize_name
+from helpers.query_utils import group_rows_by_name
 from tools.metrics.info import (
     get_advanced_passing_stats,
     get_advanced_receiving_stats,
     get_advanced_rushing_stats,
 )
 
+# Upper bound on distinct names/IDs per lookup; keeps the OR filter (and the
+# resulting index probes) from growing without limit.
+_MAX_LOOKUP_NAMES = 25
 
-def get_player_info(supabase: Client, player_names: list[str]) -> list[dict]:
+_PLAYER_COLS = "display_name,merge_name,latest_team,position,height,weight,age,sleeper_id,gsis_id,years_of_experience"
+_ALLOWED_PLAYER_COLS = frozenset(_PLAYER_COLS.split(","))
+
+# Profile stat categories: (profile key, fetcher, fetcher return key, positions the
+# underlying view covers). Positions mirror each view's default_positions.
+_PROFILE_STAT_CATEGORIES = (
+    ("receivingStats", get_advanced_receiving_stats, "advReceivingStats", frozenset({"WR", "TE", "RB"})),
+    ("passingStats", get_advanced_passing_stats, "advPassingStats", frozenset({"QB"})),
+    ("rushingStats", get_advanced_rushing_stats, "advRushingStats", frozenset({"RB", "QB"})),
+)
+
+
+class PlayerRow(TypedDict, total=False):
+    """Row shape returned by mv_player_id_lookup player queries."""
+
+    display_name: str
+    merge_name: str | None
+    latest_team: str | None
+    position: str | None
+    height: int | None
+    weight: int | None
+    age: float | None
+    sleeper_id: int | None
+    gsis_id: str | None
+    years_of_experience: int | None
+
+
+def get_player_info(supabase: Client, player_names: list[str], columns: list[str] | None = None) -> list[PlayerRow]:
     """
     Fetch basic information for players such as: name, latest team, position,
     height, weight, birthdate (age) and identifiers.
@@ -22,27 +54,73 @@ def get_player_info(supabase: Client, player_names: list[str]) -> list[dict]:
     Args:
         supabase: The Supabase client instance
         player_names: List of player names to search for
+        columns: Optional subset of PlayerRow columns to return (defaults to all).
+            Include merge_name/display_name if the rows are passed to match_player_info.
+
+    Raises:
+        ValueError: If columns contains names outside PlayerRow
     """
+    if columns:
+        unknown = set(columns) - _ALLOWED_PLAYER_COLS
+        if unknown:
+            raise ValueError(f"Unknown player info columns: {sorted(unknown)}")
+    select_cols = ",".join(dict.fromkeys(columns)) if columns else _PLAYER_COLS
     try:
         if not player_names:
             return [{"error": "Please submit list of player names to search for as array of strings"}]
-        sanitized_names = [sanitize_name(name) for name in player_names]
-        query = supabase.table("mv_player_id_lookup").select(
-            "display_name, latest_team, position, height, weight, age, sleeper_id, gsis_id, years_of_experience"
-        )
-        if sanitized_names:
-            or_filter = ",".join([f"merge_name.ilike.%{name}%,display_name.ilike.%{name}%" for name in sanitized_names])
-            query = query.or_(or_filter)
-        response = query.limit(35).execute()
+        sanitized_names = dedupe_names(player_names)
+        if not sanitized_names:
+            return [{"error": "No valid player names after sanitization"}]
+        if len(sanitized_names) > _MAX_LOOKUP_NAMES:
+            return [{"error": f"Too many player names ({len(sanitized_names)}); maximum is {_MAX_LOOKUP_NAMES}"}]
+        query = supabase.table("mv_player_id_lookup").select(select_cols)
+        or_filter = ",".join([f"merge_name.ilike.%{name}%,display_name.ilike.%{name}%" for name in sanitized_names])
+        query = query.or_(or_filter)
+        # Each name is a partial match, so give every name its own 35-row budget;
+        # a shared cap lets a common surname crowd out the other requested players.
+        response = query.limit(35 * len(sanitized_names)).execute()
         return response.data
     except Exception as e:
         raise Exception(f"Error fetching player info: {e!s}") from None
 
 
-def get_players_by_sleeper_id(supabase: Client, sleeper_ids: list[str]) -> list[dict]:
+def match_player_info(player_info: list[PlayerRow], player_names: list[str]) -> dict[str, PlayerRow | None]:
+    """
+    Pick the best row for each requested name from a batched get_player_info result.
+
+    An exact merge_name/display_name match wins over a partial one, so a partial
+    match on one name (e.g. "Jefferson") doesn't shadow a fully named player.
+
+    Args:
+        player_info: Rows returned by get_player_info for all of player_names
+        player_names: The raw names that were looked up
+
+    Raises:
+        ValueError: If player_info is an error row from get_player_info (e.g. too many
+            or no valid names), so callers don't report every player as not found
+    """
+    errors = [r["error"] for r in player_info if "error" in r]
+    if errors:
+        raise ValueError(errors[0])
+    grouped = group_rows_by_name(player_info, player_names, ["merge_name", "display_name"])
+    resolved: dict[str, PlayerRow | None] = {}
+    for name, matches in grouped.items():
+        key = sanitize_name(name)
+        exact = next(
+            (r for r in matches if r.get("merge_name") == key or sanitize_name(r.get("display_name") or "") == key),
+            None,
+        )
+        resolved[name] = exact or (matches[0] if matches else None)
+    return resolved
+
+
+def get_players_by_sleeper_id(supabase: Client, sleeper_ids: list[str]) -> list[PlayerRow]:
     """
     Fetch basic information for players by their Sleeper IDs.
 
+    IDs are looked up in batches of _MAX_LOOKUP_NAMES so the OR filter stays
+    bounded; full rosters are supported and the batch results are concatenated.
+
     Args:
         supabase: The Supabase client instance
         sleeper_ids: List of Sleeper IDs to search for
@@ -50,15 +128,16 @@ def get_players_by_sleeper_id(supabase: Client, sleeper_ids: list[str]) -> list[
     try:
         if not sleeper_ids:
             return [{"error": "Please submit list of Sleeper IDs to search for as array of strings"}]
-        sanitized_ids = [sanitize_name(sleeper_id) for sleeper_id in sleeper_ids]
-        query = supabase.table("mv_player_id_lookup").select(
-            "display_name, latest_team, position, height, weight, age, sleeper_id, gsis_id, years_of_experience"
-        )
-        if sanitized_ids:
-            or_filter = ",".join([f"sleeper_id.eq.{sleeper_id}" for sleeper_id in sanitized_ids])
-            query = query.or_(or_filter)
-        response = query.limit(35).execute()
-        return response.data
+        sanitized_ids = dedupe_names(sleeper_ids)
+        if not sanitized_ids:
+            return [{"error": "No valid Sleeper IDs after sanitization"}]
+        rows: list[PlayerRow] = []
+        for start in range(0, len(sanitized_ids), _MAX_LOOKUP_NAMES):
+            batch = sanitized_ids[start : start + _MAX_LOOKUP_NAMES]
+            query = supabase.table("mv_player_id_lookup").select(_PLAYER_COLS)
+            query = query.or_(",".join([f"sleeper_id.eq.{sleeper_id}" for sleeper_id in batch]))
+            rows.extend(query.limit(35).execute().data)
+        return rows
     except Exception as e:
         raise Exception(f"Error fetching player info by Sleeper ID: {e!s}") from None
 
@@ -69,13 +148,15 @@ def get_player_profile(
     season_list: list[int] | None = None,
     metrics: list[str] | None = None,
     limit: int | None = 25,
+    info_columns: list[str] | None = None,
 ) -> dict:
     """
     Fetch comprehensive player profile combining basic info and all available stats.
 
     This is a unified tool that combines basic player information with receiving,
     passing, and rushing stats in a single call, reducing the need for 3-4 separate
-    tool calls to build a complete player profile.
+    tool calls to build a complete player profile. Player info is resolved first so
+    stat categories that cannot apply to the player's position are skipped.
 
     Args:
         supabase: The Supabase client instance
@@ -83,6 +164,8 @@ def get_player_profile(
         season_list: Optional list of seasons to include
         metrics: Optional list of metric codes to return
         limit: Optional max rows to return per stats category (defaults to 25)
+        info_columns: Optional subset of playerInfo columns (see get_player_info); position
+            and merge_name are always included since stat queries depend on them
 
     Returns:
         dict: Unified player profile with keys:
@@ -101,45 +184,52 @@ def get_player_profile(
                 "rushingStats": [],
             }
 
-        # Fetch player info and all stats categories in parallel
-        # (ThreadPoolExecutor avoids asyncio.run() conflicts with FastMCP's event loop)
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            future_info = executor.submit(get_player_info, supabase, player_names)
-            future_receiving = executor.submit(
-                get_advanced_receiving_stats,
-                supabase=supabase,
-                player_names=player_names,
-                season_list=season_list,
-                metrics=metrics,
-                limit=limit,
-            )
-            future_passing = executor.submit(
-                get_advanced_passing_stats,
-                supabase=supabase,
-                player_names=player_names,
-                season_list=season_list,
-                metrics=metrics,
-                limit=limit,
-            )
-            future_rushing = executor.submit(
-                get_advanced_rushing_stats,
-                supabase=supabase,
-                player_names=player_names,
-                season_list=season_list,
-                metrics=metrics,
-                limit=limit,
-            )
-            player_info = future_info.result()
-            receiving_stats = future_receiving.result()
-            passing_stats = future_passing.result()
-            rushing_stats = future_rushing.result()
-
-        return {
+        if info_columns:
+            info_columns = list(dict.fromkeys([*info_columns, "position", "merge_name"]))
+        player_info = get_player_info(supabase, player_names, columns=info_columns)
+
+        # A name counts as resolved only when it matched exactly one player row
+        # (several rows means partial-match neighbours, none means not found).
+        matches = group_rows_by_name(player_info, player_names, ["merge_name", "display_name"])
+        resolved = [rows[0] for rows in matches.values() if len(rows) == 1 and rows[0].get("merge_name")]
+        all_resolved = len(resolved) == len(matches)
+
+        # Only fetch stat categories the resolved positions can appear in (each
+        # stats view already filters to these positions, so skipped categories
+        # would come back empty). Unresolved players fall back to every category.
+        positions = {p.get("position") for p in player_info if p.get("position")}
+        wanted = [c for c in _PROFILE_STAT_CATEGORIES if not all_resolved or not positions or positions & c[3]]
+
+        # When every name resolved, reuse the merge_name keys so stats views match
+        # by indexed IN rather than re-running the ILIKE name search per category.
+        # Otherwise keep ILIKE so unresolved names still find their stats.
+        merge_names = list(dict.fromkeys(p["merge_name"] for p in resolved)) if all_resolved else None
+
+        profile: dict = {
             "playerInfo": player_info,
-            "receivingStats": receiving_stats.get("advReceivingStats", []),
-            "passingStats": passing_stats.get("advPassingStats", []),
-            "rushingStats": rushing_stats.get("advRushingStats", []),
+            "receivingStats": [],
+            "passingStats": [],
+            "rushingStats": [],
         }
+        if wanted:
+            # (ThreadPoolExecutor avoids asyncio.run() conflicts with FastMCP's event loop)
+            with ThreadPoolExecutor(max_workers=len(wanted)) as executor:
+                futures = {
+                    key: executor.submit(
+                        fetch,
+                        supabase=supabase,
+                        player_names=player_names,
+                        season_list=season_list,
+                        metrics=metrics,
+                        limit=limit,
+                        merge_names=merge_names,
+                    )
+                    for key, fetch, _, _ in wanted
+                }
+                for key, _, return_key, _ in wanted:
+                    profile[key] = futures[key].result().get(return_key, [])
+
+        return profile
 
     except Exception as e:
         raise Exception(f"Error fetching player profile: {e!s}") from None
@@ -0,0 +1,75 @@
+"""
+Process-local TTL cache for dynasty rankings.
+
+vw_dynasty_ranks changes at most daily, but the composite tools (start/sit,
+trade, deep dive, comparison, waiver) each pull the top 500 rows on every call. Caching
+the result for a few minutes turns those repeated round-trips into a memory read
+and lets back-to-back tool calls share one fetch.
+"""
+
+import threading
+import time
+
+from supabase import Client
+
+from tools.ranks.info import get_fantasy_ranks
+
+_RANKS_TTL = 300  # 5 minutes
+# Columns the cached rows must carry. compare_players returns each matched row
+# whole as dynastyRankings[].ranking, so this is every rank column, not just the
+# ecr/pos/team the other composite tools read.
+_CACHED_RANK_FIELDS = [
+    "player",
+    "team",
+    "pos",
+    "ecr",
+    "age",
+    "years_of_experience",
+    "team_nfl",
+    "team_full",
+    "player_owned_avg",
+]
+# (url, limit) -> (ranks list, {lowercased player name: entry}, fetched_at)
+_ranks_cache: dict[tuple, tuple[list[dict], dict[str, dict], float]] = {}
+_ranks_cache_lock = threading.Lock()
+
+
+def _load_ranks(supabase: Client, limit: int) -> tuple[list[dict], dict[str, dict], float]:
+    """Return the cache entry for (supabase, limit), refetching when stale."""
+    key = (getattr(supabase, "supabase_url", None), limit)
+    with _ranks_cache_lock:
+        entry = _ranks_cache.get(key)
+        if entry and (time.monotonic() - entry[2]) <= _RANKS_TTL:
+            return entry
+
+    ranks = get_fantasy_ranks(supabase=supabase, limit=limit, fields=_CACHED_RANK_FIELDS)
+    # Built once per refresh; later entries win, matching the per-request loops it replaces
+    by_name = {e["player"].lower(): e for e in ranks if e.get("player")}
+    entry = (ranks, by_name, time.monotonic())
+    with _ranks_cache_lock:
+        _ranks_cache[key] = entry
+    return entry
+
+
+def get_cached_fantasy_ranks(supabase: Client, limit: int = 500) -> list[dict]:
+    """Return dynasty ranks ordered by ECR, served from cache while fresh.
+
+    The returned list is shared between callers and must not be mutated.
+
+    Args:
+        supabase: The Supabase client instance
+        limit: Maximum number of rows to fetch (defaults to 500)
+    """
+    return _load_ranks(supabase, limit)[0]
+
+
+def get_cached_rankings_by_name(supabase: Client, limit: int = 500) -> dict[str, dict]:
+    """Return dynasty ranks keyed by lowercased player name, served from cache while fresh.
+
+    The returned dict is shared between callers and must not be mutated.
+
+    Args:
+        supabase: The Supabase client instance
+        limit: Maximum number of rows to fetch (defaults to 500)
+    """
+    return _load_ranks(supabase, limit)[1]
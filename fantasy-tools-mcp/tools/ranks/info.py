@@ -2,8 +2,25 @@
 Dynasty ranks tools for MCP
 """
 
+from typing import TypedDict
+
 from supabase import Client
 
+
+class RankRow(TypedDict, total=False):
+    """Row shape returned by vw_dynasty_ranks rank queries."""
+
+    player: str
+    team: str | None
+    pos: str | None
+    ecr: float | None
+    age: float | None
+    years_of_experience: int | None
+    team_nfl: str | None
+    team_full: str | None
+    player_owned_avg: float | None
+
+
 # Tool 1: Get distinct page_type values for context
 
 
@@ -20,10 +37,31 @@ def get_fantasy_rank_page_types(supabase: Client) -> list[str]:
 
 # Tool 2: Get dynasty ranks, filtered by position (optional), limited to 150 rows
 
+# Columns callers may request via `fields`. The default returns all of them;
+# callers that only read a few (e.g. ecr/pos/team) pass a narrower `fields`.
+_ALLOWED_RANK_COLUMNS = frozenset(
+    {
+        "player",
+        "team",
+        "pos",
+        "ecr",
+        "age",
+        "years_of_experience",
+        "team_nfl",
+        "team_full",
+        "player_owned_avg",
+    }
+)
+_DEFAULT_RANK_SELECT = "player,team,pos,ecr,age,years_of_experience,team_nfl,team_full,player_owned_avg"
+
 
 def get_fantasy_ranks(
-    supabase: Client, position: str | None = None, page_type: str | None = None, limit: int = 30
-) -> list[dict]:
+    supabase: Client,
+    position: str | None = None,
+    page_type: str | None = None,
+    limit: int = 30,
+    fields: list[str] | None = None,
+) -> list[RankRow]:
     """
     Returns fantasy ranks from vw_dynasty_ranks, filtered by position and/or page_type if provided.
 
@@ -32,22 +70,21 @@ def get_fantasy_ranks(
     - position: optional position filter (e.g., 'RB', 'WR')
     - page_type: optional page_type filter
     - limit: maximum number of rows to return (defaults to 30)
+    - fields: optional subset of columns to return. Defaults to every allowed column:
+      player, team, pos, ecr, age, years_of_experience, team_nfl, team_full, player_owned_avg.
 
-    Selects the most pertinent columns for fantasy analysis.
+    Raises:
+    - ValueError: If fields contains a column outside the allowed set
     """
-    columns = [
-        "player",
-        "team",
-        "pos",
-        "ecr",
-        "age",
-        "years_of_experience",
-        "team_nfl",
-        "team_full",
-        "player_owned_avg",
-    ]
+    if fields:
+        unknown = [f for f in fields if f not in _ALLOWED_RANK_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown rank fields: {', '.join(unknown)}")
+        select_cols = ",".join(dict.fromkeys(fields))
+    else:
+        select_cols = _DEFAULT_RANK_SELECT
     try:
-        query = supabase.table("vw_dynasty_ranks").select(",".join(columns))
+        query = supabase.table("vw_dynasty_ranks").select(select_cols)
         if position:
             query = query.eq("pos", position)
         if page_type:
@@ -36,10 +36,16 @@ def register_tools(mcp: FastMCP, supabase: Client):
             "Fetch dynasty ranks from vw_dynasty_ranks, filtered by position and/or page_type (optional). "
             "Use for dynasty trade value assessment, player valuation, buy-low/sell-high target identification, "
             "positional rankings, and expert consensus ranking (ECR). "
-            "Accepts an optional `limit` (default 30) to control rows returned. Returns the most pertinent columns for fantasy analysis."
+            "Accepts an optional `limit` (default 30) to control rows returned. "
+            "Returns the most pertinent columns for fantasy analysis by default: "
+            "player, team, pos, ecr, age, years_of_experience, team_nfl, team_full, player_owned_avg. "
+            "Pass `fields` to return only a subset of those columns."
         ),
     )
     def get_fantasy_ranks(
-        position: str | None = None, page_type: str | None = None, limit: int | None = 30
+        position: str | None = None,
+        page_type: str | None = None,
+        limit: int | None = 30,
+        fields: list[str] | None = None,
     ) -> list[dict]:
-        return _get_fantasy_ranks(supabase, position, page_type, limit)
+        return _get_fantasy_ranks(supabase, position, page_type, limit, fields)
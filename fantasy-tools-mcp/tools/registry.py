@@ -5,7 +5,9 @@ Central registry for all MCP tools.
 import importlib.util
 import os
 import sys
+from functools import lru_cache
 
+import orjson
 from fastmcp import FastMCP
 from supabase import Client
 
@@ -79,51 +81,55 @@ def _register_resources(mcp: FastMCP):
         """
         NFL receiving metrics definitions organized by volume, efficiency, and situational categories.
         """
-        catalog = _load_metrics_catalog_dict()
-        return str(catalog.get("receiving", {}))
+        return _metrics_category_json("receiving")
 
     @mcp.resource("metrics://passing")
     def get_passing_metrics() -> str:
         """
         NFL passing metrics definitions organized by volume, efficiency, and situational categories.
         """
-        catalog = _load_metrics_catalog_dict()
-        return str(catalog.get("passing", {}))
+        return _metrics_category_json("passing")
 
     @mcp.resource("metrics://rushing")
     def get_rushing_metrics() -> str:
         """
         NFL rushing metrics definitions organized by volume, efficiency, and situational categories.
         """
-        catalog = _load_metrics_catalog_dict()
-        return str(catalog.get("rushing", {}))
+        return _metrics_category_json("rushing")
 
     @mcp.resource("metrics://defense")
     def get_defense_metrics() -> str:
         """
         NFL defensive metrics definitions organized by volume, efficiency, and situational categories.
         """
-        catalog = _load_metrics_catalog_dict()
-        return str(catalog.get("defense", {}))
+        return _metrics_category_json("defense")
 
 
+@lru_cache(maxsize=1)
 def _load_metrics_catalog() -> str:
-    """Load the complete metrics catalog as a formatted string."""
+    """Load the complete metrics catalog as a formatted string (built once, then cached)."""
     catalog = _load_metrics_catalog_dict()
 
     # Format as readable text
-    result = "# NFL Metrics Catalog\n\n"
+    parts = ["# NFL Metrics Catalog\n\n"]
 
     for category, subcategories in catalog.items():
-        result += f"## {category.title()} Metrics\n\n"
+        parts.append(f"## {category.title()} Metrics\n\n")
 
         for subcat, metrics in subcategories.items():
-            result += f"### {subcat.replace('_', ' ').title()}\n"
+            parts.append(f"### {subcat.replace('_', ' ').title()}\n")
             for metric, definition in metrics.items():
-                result += f"- **{metric}**: {definition}\n"
-            result += "\n"
+                parts.append(f"- **{metric}**: {definition}\n")
+            parts.append("\n")
 
-    return result
+    return "".join(parts)
+
+
+@lru_cache(maxsize=8)
+def _metrics_category_json(category: str) -> str:
+    """Serialize one metrics catalog category as JSON (cached; the catalog is static)."""
+    catalog = _load_metrics_catalog_dict()
+    return orjson.dumps(catalog.get(category, {})).decode()
 
 
 def _load_metrics_catalog_dict() -> dict:
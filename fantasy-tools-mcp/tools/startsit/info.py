@@ -2,22 +2,42 @@
 Start/sit context composite tool for assembling weekly decision data.
 
 Fetches player season stats with positional percentile ranks, weekly performance,
-consistency metrics, and dynasty rankings in parallel using ThreadPoolExecutor.
+consistency metrics, and dynasty rankings in parallel using ThreadPoolExecutor, with one
+batched query per data category covering every requested player. Receiving, passing,
+and rushing season stats come back together from the player_season_card RPC.
 Returns a data-only bundle with zero analysis or opinions — the LLM interprets the data.
 """
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import partial
 
 from supabase import Client
 
-from helpers.query_utils import build_player_stats_query
-from tools.metrics.info import (
-    get_advanced_passing_stats,
-    get_advanced_receiving_stats,
-    get_advanced_rushing_stats,
+from helpers.cache_utils import TTLCache
+from helpers.executor_utils import FETCH_EXECUTOR
+from helpers.name_utils import sanitize_name
+from helpers.query_utils import (
+    build_player_stats_query,
+    group_rows_by_name,
+    query_player_season_card,
+    query_rows_per_name,
 )
-from tools.player.info import get_player_info
-from tools.ranks.info import get_fantasy_ranks
+from tools.player.info import get_player_info, match_player_info
+from tools.ranks.cache import get_cached_rankings_by_name
+
+# Batched queries request this multiple of the per-player row count for each name
+_BATCH_HEADROOM = 2
+
+# Positions each season-stats view covers (mirrors their default_positions)
+_RECEIVING_POSITIONS = frozenset({"WR", "TE", "RB"})
+_PASSING_POSITIONS = frozenset({"QB"})
+_RUSHING_POSITIONS = frozenset({"RB", "QB"})
+
+# Player info columns the bundle reads (names are needed to match rows back to input)
+_INFO_COLUMNS = ["display_name", "merge_name", "position", "latest_team", "age"]
+
+# Columns every season-stats row carries (merge_name keys rows back to names)
+_SEASON_BASE_COLS = ["season", "player_name", "ff_team", "ff_position", "merge_name"]
 
 # Position-appropriate metrics (043)
 # Receiving pctile columns live in mv_receiving_percentile_ranks (separate MV)
@@ -43,6 +63,7 @@ _RECEIVING_PCTILE_COLS = [
     "catch_percentage_pctile",
     "avg_yac_pctile",
 ]
+_RECEIVING_PCTILE_SET = frozenset(_RECEIVING_PCTILE_COLS)
 
 _PASSING_METRICS = [
     "passing_yards",
@@ -76,6 +97,174 @@ _RUSHING_METRICS = [
     "avg_rush_yards_pctile",
 ]
 
+# Columns the player_season_card RPC returns per category
+_SEASON_CARD_COLS = {
+    "receiving": [*_SEASON_BASE_COLS, *_RECEIVING_METRICS],
+    "passing": [*_SEASON_BASE_COLS, *_PASSING_METRICS],
+    "rushing": [*_SEASON_BASE_COLS, *_RUSHING_METRICS],
+}
+
+
+def _merge_receiving_pctile(receiving: dict[str, list[dict]], recv_pctile: dict[str, list[dict]]) -> set[str]:
+    """
+    Copy mv_receiving_percentile_ranks columns onto each player's matching receiving season rows.
+
+    Receiving rows may be shared with _season_card_cache, so merged rows are new
+    dicts and each player's list in receiving is replaced rather than edited in place.
+
+    Returns:
+        set: Names that received at least one percentile column
+    """
+    merged: set[str] = set()
+    for name, recv_rows in receiving.items():
+        pctile_rows = recv_pctile.get(name)
+        if recv_rows and pctile_rows:
+            pctile_by_season = {r.get("season"): r for r in pctile_rows}
+            merged_rows = []
+            for row in recv_rows:
+                pctile = pctile_by_season.get(row.get("season"))
+                if pctile:
+                    row = {**row, **{k: v for k, v in pctile.items() if k in _RECEIVING_PCTILE_SET}}
+                    merged.add(name)
+                merged_rows.append(row)
+            receiving[name] = merged_rows
+    return merged
+
+
+# --- Fetch functions (one query per category for all players) ---
+# Batch limits leave _BATCH_HEADROOM for partial-match neighbours (e.g. a second
+# "Jefferson"); query_rows_per_name re-queries any player the full batch cut short.
+# Season stats and consistency change at most weekly, so per-player results are
+# kept briefly and repeat players across calls skip the round-trip.
+_season_card_cache = TTLCache(maxsize=512, ttl=120)
+_consistency_cache = TTLCache(maxsize=512, ttl=120)
+
+
+def _fetch_info(supabase: Client, names: list[str]) -> dict[str, dict | None]:
+    try:
+        return match_player_info(get_player_info(supabase, names, columns=_INFO_COLUMNS), names)
+    except ValueError:
+        # Rejected lookup (e.g. no valid names) is a caller error, not "player not found"
+        raise
+    except Exception:
+        return {}
+
+
+def _fetch_season_card(supabase: Client, names_by_category: dict[str, list[str]]) -> dict[str, dict[str, list[dict]]]:
+    cats_by_name: dict[str, tuple[str, ...]] = {}
+    for cat, names in names_by_category.items():
+        for n in names:
+            cats_by_name[n] = (*cats_by_name.get(n, ()), cat)
+
+    def _query_misses(misses: list[str]) -> dict[str, dict[str, list[dict]]]:
+        return query_player_season_card(
+            supabase,
+            {cat: [n for n in names if n in misses] for cat, names in names_by_category.items()},
+            _SEASON_CARD_COLS,
+        )
+
+    try:
+        # Keyed by name + requested categories, so a cached entry always covers what is asked
+        by_name = _season_card_cache.get_or_fetch_many(
+            list(cats_by_name), _query_misses, key_fn=lambda n: (sanitize_name(n), cats_by_name[n])
+        )
+    except Exception:
+        return {cat: {} for cat in _SEASON_CARD_COLS}
+    return {
+        cat: {n: (by_name.get(n) or {}).get(cat, []) for n in names_by_category.get(cat, [])}
+        for cat in _SEASON_CARD_COLS
+    }
+
+
+def _fetch_weekly(supabase: Client, names: list[str], week: int, season: int | None) -> dict[str, list[dict]]:
+    try:
+        # Without a season filter only the current season is wanted, which the
+        # much smaller mv_weekly_stats_current serves directly. Filtering to a single
+        # week and season leaves one row per player, so the batch limit can't crowd
+        # a requested player out (only partial-match neighbours share it).
+        result = build_player_stats_query(
+            supabase=supabase,
+            table_name="nflreadr_nfl_player_stats" if season else "mv_weekly_stats_current",
+            base_columns=["season", "week", "player_display_name", "recent_team", "position"],
+            player_name_column="player_display_name",
+            position_column="position",
+            default_positions=["QB", "RB", "WR", "TE"],
+            return_key="weeklyStats",
+            player_names=names,
+            weekly_list=[week],
+            season_list=[season] if season else None,
+            metrics=["fantasy_points", "fantasy_points_ppr"],
+            limit=5 * len(names) * _BATCH_HEADROOM,
+            player_sort_column="player_display_name",
+        )
+        return group_rows_by_name(result.get("weeklyStats", []), names, ["player_display_name"], 5)
+    except Exception:
+        return {}
+
+
+def _query_consistency(supabase: Client, names: list[str]) -> dict[str, dict | None]:
+    grouped = query_rows_per_name(
+        supabase,
+        names,
+        ["merge_name"],
+        1,
+        headroom=_BATCH_HEADROOM,
+        table_name="mv_player_consistency",
+        base_columns=[
+            "merge_name",
+            "season",
+            "ff_position",
+            "games_played",
+            "avg_fp_ppr",
+            "fp_stddev_ppr",
+            "fp_floor_p10",
+            "fp_ceiling_p90",
+            "fp_median_ppr",
+            "boom_games_20plus",
+            "bust_games_under_5",
+            "consistency_coefficient",
+        ],
+        player_name_column="merge_name",
+        position_column="ff_position",
+        default_positions=["QB", "RB", "WR", "TE"],
+        return_key="consistency",
+    )
+    return {n: rows[0] if rows else None for n, rows in grouped.items()}
+
+
+def _fetch_consistency(supabase: Client, names: list[str]) -> dict[str, dict | None]:
+    try:
+        return _consistency_cache.get_or_fetch_many(names, partial(_query_consistency, supabase))
+    except Exception:
+        return {}
+
+
+def _fetch_receiving_pctile(supabase: Client, names: list[str]) -> dict[str, list[dict]]:
+    try:
+        return query_rows_per_name(
+            supabase,
+            names,
+            ["merge_name"],
+            3,
+            headroom=_BATCH_HEADROOM,
+            table_name="mv_receiving_percentile_ranks",
+            base_columns=["merge_name", "ff_position", "season"],
+            player_name_column="merge_name",
+            position_column="ff_position",
+            default_positions=["WR", "TE", "RB"],
+            return_key="recvPctile",
+            metrics=_RECEIVING_PCTILE_COLS,
+        )
+    except Exception:
+        return {}
+
+
+def _fetch_dynasty_ranks(supabase: Client) -> dict[str, dict]:
+    try:
+        return get_cached_rankings_by_name(supabase)
+    except Exception:
+        return {}
+
 
 def get_start_sit_context(
     supabase: Client,
@@ -89,7 +278,8 @@ def get_start_sit_context(
 
     Fetches player info, position-appropriate season stats with positional percentile
     ranks, weekly performance for the specified week, consistency metrics, and dynasty
-    rankings. All internal fetches run in parallel via ThreadPoolExecutor.
+    rankings. All internal fetches run in parallel via ThreadPoolExecutor; season
+    stats are only fetched for players whose position the category covers.
 
     Args:
         supabase: The Supabase client instance
@@ -105,6 +295,9 @@ def get_start_sit_context(
             - scoring_format: Scoring format string
             - data_season: Most recent season in the data
             - players_not_found: Names that couldn't be resolved
+            - missing_required_data: {player_name, reason} entries for players missing
+              consistency ("consistency_unavailable") or percentile ranks
+              ("percentile_ranks_unavailable"), or None
     """
     if not player_names:
         raise ValueError("player_names must contain at least one player")
@@ -115,169 +308,72 @@ def get_start_sit_context(
 
     unique_names = list(dict.fromkeys(player_names))
 
-    # --- Internal fetch functions ---
-
-    def _fetch_info(name: str) -> list[dict] | None:
-        try:
-            return get_player_info(supabase, [name])
-        except Exception:
-            return None
-
-    def _fetch_receiving(name: str) -> list[dict]:
-        try:
-            result = get_advanced_receiving_stats(
-                supabase=supabase, player_names=[name], metrics=_RECEIVING_METRICS, limit=3
-            )
-            return result.get("advReceivingStats", [])
-        except Exception:
-            return []
-
-    def _fetch_passing(name: str) -> list[dict]:
-        try:
-            result = get_advanced_passing_stats(
-                supabase=supabase, player_names=[name], metrics=_PASSING_METRICS, limit=3
-            )
-            return result.get("advPassingStats", [])
-        except Exception:
-            return []
-
-    def _fetch_rushing(name: str) -> list[dict]:
-        try:
-            result = get_advanced_rushing_stats(
-                supabase=supabase, player_names=[name], metrics=_RUSHING_METRICS, limit=3
-            )
-            return result.get("advRushingStats", [])
-        except Exception:
-            return []
-
-    def _fetch_weekly(name: str) -> list[dict]:
-        try:
-            result = build_player_stats_query(
-                supabase=supabase,
-                table_name="nflreadr_nfl_player_stats",
-                base_columns=["season", "week", "player_display_name", "recent_team", "position"],
-                player_name_column="player_display_name",
-                position_column="position",
-                default_positions=["QB", "RB", "WR", "TE"],
-                return_key="weeklyStats",
-                player_names=[name],
-                weekly_list=[week],
-                season_list=[season] if season else None,
-                metrics=["fantasy_points", "fantasy_points_ppr"],
-                limit=5,
-                player_sort_column="player_display_name",
-            )
-            return result.get("weeklyStats", [])
-        except Exception:
-            return []
-
-    def _fetch_consistency(name: str) -> dict | None:
-        try:
-            result = build_player_stats_query(
-                supabase=supabase,
-                table_name="mv_player_consistency",
-                base_columns=[
-                    "player_name",
-                    "merge_name",
-                    "season",
-                    "ff_position",
-                    "games_played",
-                    "avg_fp_ppr",
-                    "fp_stddev_ppr",
-                    "fp_floor_p10",
-                    "fp_ceiling_p90",
-                    "fp_median_ppr",
-                    "boom_games_20plus",
-                    "bust_games_under_5",
-                    "consistency_coefficient",
-                ],
-                player_name_column="merge_name",
-                position_column="ff_position",
-                default_positions=["QB", "RB", "WR", "TE"],
-                return_key="consistency",
-                player_names=[name],
-                limit=1,
-            )
-            data = result.get("consistency", [])
-            return data[0] if data else None
-        except Exception:
-            return None
-
-    def _fetch_receiving_pctile(name: str) -> list[dict]:
-        try:
-            result = build_player_stats_query(
-                supabase=supabase,
-                table_name="mv_receiving_percentile_ranks",
-                base_columns=["merge_name", "ff_position", "season"],
-                player_name_column="merge_name",
-                position_column="ff_position",
-                default_positions=["WR", "TE", "RB"],
-                return_key="recvPctile",
-                player_names=[name],
-                metrics=_RECEIVING_PCTILE_COLS,
-                limit=3,
-            )
-            return result.get("recvPctile", [])
-        except Exception:
-            return []
-
-    def _fetch_dynasty_ranks() -> list[dict]:
-        try:
-            return get_fantasy_ranks(supabase=supabase, limit=500)
-        except Exception:
-            return []
-
-    # --- Parallel fetch (single phase — all queries at once) ---
-    worker_count = len(unique_names) * 6 + 1  # 6 fetches per player + rankings
-    max_workers = min(worker_count, 12)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        info_futures = {n: executor.submit(_fetch_info, n) for n in unique_names}
-        recv_futures = {n: executor.submit(_fetch_receiving, n) for n in unique_names}
-        recv_pctile_futures = {n: executor.submit(_fetch_receiving_pctile, n) for n in unique_names}
-        pass_futures = {n: executor.submit(_fetch_passing, n) for n in unique_names}
-        rush_futures = {n: executor.submit(_fetch_rushing, n) for n in unique_names}
-        weekly_futures = {n: executor.submit(_fetch_weekly, n) for n in unique_names}
-        consistency_futures = {n: executor.submit(_fetch_consistency, n) for n in unique_names}
-        rankings_future = executor.submit(_fetch_dynasty_ranks)
-
-        infos = {n: f.result() for n, f in info_futures.items()}
-        receiving = {n: f.result() for n, f in recv_futures.items()}
-        recv_pctile = {n: f.result() for n, f in recv_pctile_futures.items()}
-        passing = {n: f.result() for n, f in pass_futures.items()}
-        rushing = {n: f.result() for n, f in rush_futures.items()}
-        weekly = {n: f.result() for n, f in weekly_futures.items()}
-        consistency = {n: f.result() for n, f in consistency_futures.items()}
-        all_rankings = rankings_future.result()
-
-    # --- Merge receiving percentile ranks from MV into receiving stats ---
-    for name in unique_names:
-        recv_rows = receiving.get(name, [])
-        pctile_rows = recv_pctile.get(name, [])
-        if recv_rows and pctile_rows:
-            pctile_by_season = {r.get("season"): r for r in pctile_rows}
-            for row in recv_rows:
-                pctile = pctile_by_season.get(row.get("season"))
-                if pctile:
-                    for col in _RECEIVING_PCTILE_COLS:
-                        if col in pctile:
-                            row[col] = pctile[col]
-
-    # --- Build rankings lookup ---
-    rankings_by_name: dict[str, dict] = {}
-    for entry in all_rankings:
-        pname = entry.get("player", "").lower()
-        if pname:
-            rankings_by_name[pname] = entry
+    # --- Parallel fetch ---
+    # Phase 1: position-agnostic queries. Season stats wait on player info so each
+    # category is only queried for players whose position can appear in it.
+    pending = {
+        FETCH_EXECUTOR.submit(_fetch_info, supabase, unique_names): "info",
+        FETCH_EXECUTOR.submit(_fetch_weekly, supabase, unique_names, week, season): "weekly",
+        FETCH_EXECUTOR.submit(_fetch_consistency, supabase, unique_names): "consistency",
+        FETCH_EXECUTOR.submit(_fetch_dynasty_ranks, supabase): "rankings",
+    }
+    stat_positions = (
+        ("receiving", _RECEIVING_POSITIONS),
+        ("passing", _PASSING_POSITIONS),
+        ("rushing", _RUSHING_POSITIONS),
+    )
+
+    # Consume results as they land so the phase 2 submits and the percentile
+    # merge overlap the remaining fetches instead of waiting on all of them.
+    results: dict = {}
+    pctile_merged: set[str] = set()
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            kind = pending.pop(future)
+            if kind == "season_card":
+                results.update(future.result())
+            else:
+                results[kind] = future.result()
+            if kind == "info":
+                # Phase 2: unresolved players are reported as not found, so only
+                # resolved names are queried (unknown positions get every category)
+                names_by_category = {
+                    cat: [
+                        n
+                        for n, info in results["info"].items()
+                        if info and (not info.get("position") or info["position"] in positions)
+                    ]
+                    for cat, positions in stat_positions
+                }
+                if any(names_by_category.values()):
+                    pending[FETCH_EXECUTOR.submit(_fetch_season_card, supabase, names_by_category)] = "season_card"
+                else:
+                    results.update({cat: {} for cat in names_by_category})
+                if names_by_category["receiving"]:
+                    recv_names = names_by_category["receiving"]
+                    pending[FETCH_EXECUTOR.submit(_fetch_receiving_pctile, supabase, recv_names)] = "recv_pctile"
+                else:
+                    results["recv_pctile"] = {}
+            if kind in ("season_card", "recv_pctile") and "receiving" in results and "recv_pctile" in results:
+                pctile_merged = _merge_receiving_pctile(results["receiving"], results["recv_pctile"])
+
+    infos = results["info"]
+    receiving = results["receiving"]
+    passing = results["passing"]
+    rushing = results["rushing"]
+    weekly = results["weekly"]
+    consistency = results["consistency"]
+    rankings_by_name = results["rankings"]
 
     # --- Assemble player bundles ---
     players_not_found: list[str] = []
     data_season: int | None = None
+    has_pctile_by_name: dict[str, bool] = {}
 
     player_bundles = []
     for name in unique_names:
-        info_list = infos.get(name)
-        player_info = info_list[0] if info_list else None
+        player_info = infos.get(name)
 
         if not player_info:
             players_not_found.append(name)
@@ -301,11 +397,12 @@ def get_start_sit_context(
         ]:
             if stat_data:
                 season_stats[label] = stat_data
-                for row in stat_data:
-                    s = row.get("season")
-                    if s and (data_season is None or s > data_season):
-                        data_season = s
+                seasons = [row["season"] for row in stat_data if row.get("season")]
+                if seasons:
+                    data_season = max(data_season or 0, max(seasons))
         bundle["season_stats"] = season_stats
+        # Passing/rushing rows carry their pctile columns inline (see _PASSING_METRICS)
+        has_pctile_by_name[display_name] = name in pctile_merged or bool(passing.get(name) or rushing.get(name))
 
         # Weekly performance for specified week
         bundle["weekly_stats"] = weekly.get(name, [])
@@ -327,17 +424,15 @@ def get_start_sit_context(
         player_bundles.append(bundle)
 
     # --- Validate required fields (percentile ranks + consistency) ---
-    missing_required: list[str] = []
+    missing_required: list[dict] = []
     for bundle in player_bundles:
         pname = bundle["player_name"]
         if bundle.get("consistency") is None:
-            missing_required.append(f"{pname}: consistency metrics unavailable")
+            missing_required.append({"player_name": pname, "reason": "consistency_unavailable"})
         stats = bundle.get("season_stats", {})
-        has_pctile = any(
-            any(k.endswith("_pctile") for k in row) for cat in stats.values() if isinstance(cat, list) for row in cat
-        )
+        has_pctile = has_pctile_by_name.get(pname, False)
         if stats and not has_pctile:
-            missing_required.append(f"{pname}: positional percentile ranks unavailable")
+            missing_required.append({"player_name": pname, "reason": "percentile_ranks_unavailable"})
 
     return {
         "players": player_bundles,
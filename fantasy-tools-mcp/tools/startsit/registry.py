@@ -38,7 +38,9 @@ def register_tools(mcp: FastMCP, supabase: Client):
             "Each player bundle includes: basic info (name, position, team, age), "
             "season stats with positional percentile ranks (e.g. target_share_pctile: 95 means "
             "top 5% at position), weekly performance for the specified week, consistency metrics "
-            "(avg FP, floor/ceiling, boom/bust counts, consistency coefficient), and dynasty ranking.\n\n"
+            "(avg FP, floor/ceiling, boom/bust counts, consistency coefficient), and dynasty ranking. "
+            "missing_required_data lists {player_name, reason} entries with reason "
+            "'consistency_unavailable' or 'percentile_ranks_unavailable'.\n\n"
             "Keywords: start/sit, lineup decision, who do I start, weekly lineup, matchup analysis, "
             "flex play, streaming, DFS, daily fantasy"
         ),
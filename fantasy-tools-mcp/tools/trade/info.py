@@ -2,17 +2,197 @@
 Trade context composite tool for assembling trade evaluation data.
 
 Fetches player profiles, dynasty rankings, consistency metrics, and optional
-league context in parallel using ThreadPoolExecutor. Returns a data-only bundle
+league context in parallel using ThreadPoolExecutor, with one batched query
+per data category covering both sides of the trade (the optional weekly trend
+is fetched per player so each gets its own most recent weeks). Returns a data-only bundle
 with zero analysis or opinions — the LLM interprets the data.
 """
 
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, wait
+from functools import partial
 
 from supabase import Client
 
-from helpers.query_utils import build_player_stats_query
-from tools.player.info import get_player_profile
-from tools.ranks.info import get_fantasy_ranks
+from helpers.cache_utils import TTLCache
+from helpers.executor_utils import FETCH_EXECUTOR
+from helpers.query_utils import build_player_stats_query, query_rows_per_name
+from tools.fantasy.sleeper_wrapper.league import League
+from tools.player.info import get_player_profile, match_player_info
+from tools.ranks.cache import get_cached_rankings_by_name
+
+# Batched queries request this multiple of the per-player row count for each name
+_BATCH_HEADROOM = 2
+
+# (bundle label, get_player_profile key) for season stat categories
+_PROFILE_STAT_KEYS = (
+    ("receiving", "receivingStats"),
+    ("passing", "passingStats"),
+    ("rushing", "rushingStats"),
+)
+
+# Player info columns the bundle reads (names are needed to match rows back to input)
+_INFO_COLUMNS = ["display_name", "merge_name", "position", "latest_team", "age", "years_of_experience"]
+
+# Ranking columns mv_player_trade_card adds on top of mv_player_consistency
+_CARD_RANK_COLS = ("ecr", "rank_pos", "rank_team")
+
+# Seconds to keep waiting on optional fetches once the required data is in
+_OPTIONAL_FETCH_TIMEOUT_S = 2.0
+
+
+def _result_within(future: Future, timeout: float, default):
+    """Return the future's result if it finishes within timeout, else default.
+
+    A running future can't be cancelled, so on timeout the fetch keeps running in
+    the background and holds its pool worker until it finishes; only the caller
+    stops waiting for it.
+    """
+    done, _ = wait([future], timeout=timeout)
+    if future in done:
+        return future.result()
+    return default
+
+
+# --- Fetch functions (each handles its own errors for graceful degradation) ---
+# Each category is fetched once for all players and split back per name; batch
+# limits leave _BATCH_HEADROOM for partial-match neighbours (see start/sit), and
+# players a full batch cut short are re-queried on their own.
+# Per-player profiles and trade cards are kept briefly so repeat players across
+# sequential trade evaluations skip the round-trip.
+_profile_cache = TTLCache(maxsize=512, ttl=120)
+_card_cache = TTLCache(maxsize=512, ttl=120)
+
+
+def _query_profiles(supabase: Client, names: list[str]) -> dict[str, dict | None]:
+    """Batched get_player_profile split per name: {name: {"info", "receiving", "passing", "rushing"}}."""
+    limit = 3 * len(names) * _BATCH_HEADROOM
+    profile = get_player_profile(
+        supabase=supabase,
+        player_names=names,
+        metrics=["merge_name", "fantasy_points", "fantasy_points_ppr"],
+        limit=limit,
+        info_columns=_INFO_COLUMNS,
+    )
+    infos = match_player_info(profile.get("playerInfo", []), names)
+    by_name: dict[str, dict | None] = {}
+    for name, info in infos.items():
+        if not info:
+            by_name[name] = None
+            continue
+        # Stats rows belong to the resolved player only (not partial-match neighbours)
+        merge_name = info.get("merge_name")
+        by_name[name] = {"info": info}
+        for label, stat_key in _PROFILE_STAT_KEYS:
+            by_name[name][label] = [r for r in profile.get(stat_key, []) if r.get("merge_name") == merge_name][:3]
+
+    # Stats rows are season-major with no per-player cap, so a full category may
+    # have cut off a player whose recent seasons sort late; re-query those alone
+    full = [label for label, stat_key in _PROFILE_STAT_KEYS if len(profile.get(stat_key, [])) >= limit]
+    if full and len(names) > 1:
+        for name, entry in list(by_name.items()):
+            if entry and any(len(entry[label]) < 3 for label in full):
+                by_name.update(_query_profiles(supabase, [name]))
+    return by_name
+
+
+def _fetch_profiles(supabase: Client, names: list[str]) -> dict[str, dict | None]:
+    try:
+        return _profile_cache.get_or_fetch_many(names, partial(_query_profiles, supabase))
+    except ValueError:
+        # Rejected lookup (e.g. no valid names) is a caller error, not "player not found"
+        raise
+    except Exception:
+        return {}
+
+
+def _fetch_dynasty_ranks(supabase: Client) -> dict[str, dict]:
+    try:
+        return get_cached_rankings_by_name(supabase)
+    except Exception:
+        return {}
+
+
+def _query_trade_cards(supabase: Client, names: list[str]) -> dict[str, dict | None]:
+    grouped = query_rows_per_name(
+        supabase,
+        names,
+        ["merge_name"],
+        1,
+        headroom=_BATCH_HEADROOM,
+        table_name="mv_player_trade_card",
+        base_columns=[
+            "merge_name",
+            "season",
+            "games_played",
+            "avg_fp_ppr",
+            "fp_stddev_ppr",
+            "fp_floor_p10",
+            "fp_ceiling_p90",
+            "fp_median_ppr",
+            "boom_games_20plus",
+            "bust_games_under_5",
+            "consistency_coefficient",
+            *_CARD_RANK_COLS,
+        ],
+        player_name_column="merge_name",
+        position_column="ff_position",
+        default_positions=["QB", "RB", "WR", "TE"],
+        return_key="tradeCards",
+    )
+    return {n: rows[0] if rows else None for n, rows in grouped.items()}
+
+
+def _fetch_trade_cards(supabase: Client, names: list[str]) -> dict[str, dict | None]:
+    try:
+        return _card_cache.get_or_fetch_many(names, partial(_query_trade_cards, supabase))
+    except Exception:
+        return {}
+
+
+def _fetch_league_context(lid: str) -> dict | None:
+    try:
+        league = League(lid)
+        league_data = league.get_league()
+        return {
+            "league_id": lid,
+            "name": league_data.get("name"),
+            "total_rosters": league_data.get("total_rosters"),
+            "roster_positions": league_data.get("roster_positions"),
+            "scoring_settings": league_data.get("scoring_settings"),
+            "season": league_data.get("season"),
+            "status": league_data.get("status"),
+        }
+    except Exception:
+        return None
+
+
+def _fetch_weekly_trend(supabase: Client, name: str, weeks: int) -> list[dict]:
+    # One query per player: a batched query is season-major with no per-player
+    # cap, so one player's latest-season weeks would fill the whole limit
+    try:
+        result = build_player_stats_query(
+            supabase=supabase,
+            table_name="nflreadr_nfl_player_stats",
+            base_columns=[
+                "season",
+                "week",
+                "player_display_name",
+                "recent_team",
+                "position",
+            ],
+            player_name_column="player_display_name",
+            position_column="position",
+            default_positions=["QB", "RB", "WR", "TE"],
+            return_key="weeklyTrend",
+            player_names=[name],
+            metrics=["fantasy_points", "fantasy_points_ppr"],
+            limit=weeks,
+            player_sort_column="week",
+            player_sort_desc=True,
+        )
+        return result.get("weeklyTrend", [])
+    except Exception:
+        return []
 
 
 def get_trade_context(
@@ -67,126 +247,24 @@ def get_trade_context(
     # Deduplicate while preserving order
     all_names = list(dict.fromkeys(give_player_names + receive_player_names))
 
-    # --- Internal fetch functions (each handles its own errors for graceful degradation) ---
-
-    def _fetch_profile(name: str) -> dict | None:
-        try:
-            return get_player_profile(
-                supabase=supabase,
-                player_names=[name],
-                metrics=["fantasy_points", "fantasy_points_ppr"],
-                limit=3,
-            )
-        except Exception:
-            return None
-
-    def _fetch_dynasty_ranks() -> list[dict]:
-        try:
-            return get_fantasy_ranks(supabase=supabase, limit=500)
-        except Exception:
-            return []
-
-    def _fetch_consistency(name: str) -> dict | None:
-        try:
-            result = build_player_stats_query(
-                supabase=supabase,
-                table_name="mv_player_consistency",
-                base_columns=[
-                    "player_name",
-                    "merge_name",
-                    "season",
-                    "games_played",
-                    "avg_fp_ppr",
-                    "fp_stddev_ppr",
-                    "fp_floor_p10",
-                    "fp_ceiling_p90",
-                    "fp_median_ppr",
-                    "boom_games_20plus",
-                    "bust_games_under_5",
-                    "consistency_coefficient",
-                ],
-                player_name_column="merge_name",
-                position_column="ff_position",
-                default_positions=["QB", "RB", "WR", "TE"],
-                return_key="consistency",
-                player_names=[name],
-                limit=1,
-            )
-            data = result.get("consistency", [])
-            return data[0] if data else None
-        except Exception:
-            return None
-
-    def _fetch_league_context(lid: str) -> dict | None:
-        try:
-            from tools.fantasy.sleeper_wrapper.league import League
-
-            league = League(lid)
-            league_data = league.get_league()
-            return {
-                "league_id": lid,
-                "name": league_data.get("name"),
-                "total_rosters": league_data.get("total_rosters"),
-                "roster_positions": league_data.get("roster_positions"),
-                "scoring_settings": league_data.get("scoring_settings"),
-                "season": league_data.get("season"),
-                "status": league_data.get("status"),
-            }
-        except Exception:
-            return None
-
-    def _fetch_weekly_trend(name: str, weeks: int) -> list[dict]:
-        try:
-            result = build_player_stats_query(
-                supabase=supabase,
-                table_name="nflreadr_nfl_player_stats",
-                base_columns=[
-                    "season",
-                    "week",
-                    "player_display_name",
-                    "recent_team",
-                    "position",
-                ],
-                player_name_column="player_display_name",
-                position_column="position",
-                default_positions=["QB", "RB", "WR", "TE"],
-                return_key="weeklyTrend",
-                player_names=[name],
-                metrics=["fantasy_points", "fantasy_points_ppr"],
-                limit=weeks,
-                player_sort_column="player_display_name",
-            )
-            return result.get("weeklyTrend", [])
-        except Exception:
-            return []
-
-    # --- Parallel fetch ---
-    worker_count = len(all_names) * 2 + 2
+    # --- Parallel fetch (one query per category; weekly trend per player) ---
+    profiles_future = FETCH_EXECUTOR.submit(_fetch_profiles, supabase, all_names)
+    rankings_future = FETCH_EXECUTOR.submit(_fetch_dynasty_ranks, supabase)
+    cards_future = FETCH_EXECUTOR.submit(_fetch_trade_cards, supabase, all_names)
+    league_future = FETCH_EXECUTOR.submit(_fetch_league_context, league_id) if league_id else None
+    weekly_futures: dict[str, Future] = {}
     if include_weekly:
-        worker_count += len(all_names)
-    max_workers = min(worker_count, 12)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        profile_futures = {name: executor.submit(_fetch_profile, name) for name in all_names}
-        rankings_future = executor.submit(_fetch_dynasty_ranks)
-        consistency_futures = {name: executor.submit(_fetch_consistency, name) for name in all_names}
-        league_future = executor.submit(_fetch_league_context, league_id) if league_id else None
-        weekly_futures = {}
-        if include_weekly:
-            weekly_futures = {name: executor.submit(_fetch_weekly_trend, name, recent_weeks) for name in all_names}
-
-        profiles = {name: f.result() for name, f in profile_futures.items()}
-        all_rankings = rankings_future.result()
-        consistency = {name: f.result() for name, f in consistency_futures.items()}
-        league_context = league_future.result() if league_future else None
-        weekly_data = {name: f.result() for name, f in weekly_futures.items()} if include_weekly else {}
+        weekly_futures = {
+            name: FETCH_EXECUTOR.submit(_fetch_weekly_trend, supabase, name, recent_weeks) for name in all_names
+        }
 
-    # --- Build rankings lookup (by lowercased player name) ---
-    rankings_by_name: dict[str, dict] = {}
-    for rank_entry in all_rankings:
-        player_name = rank_entry.get("player", "").lower()
-        if player_name:
-            rankings_by_name[player_name] = rank_entry
+    profiles = profiles_future.result()
+    trade_cards = cards_future.result()
+    weekly_data = {name: f.result() for name, f in weekly_futures.items()}
+    # Rankings (a cache miss refetches 500 rows) and Sleeper league context are
+    # optional context: give them a short deadline rather than stalling the bundle
+    rankings_by_name = _result_within(rankings_future, _OPTIONAL_FETCH_TIMEOUT_S, {})
+    league_context = _result_within(league_future, _OPTIONAL_FETCH_TIMEOUT_S, None) if league_future else None
 
     # --- Assemble player bundles ---
     players_not_found: list[str] = []
@@ -197,15 +275,10 @@ def get_trade_context(
         nonlocal data_season
 
         profile = profiles.get(name)
-        player_info = None
-        if profile:
-            info_list = profile.get("playerInfo", [])
-            if info_list:
-                player_info = info_list[0]
-
-        if not player_info:
+        if not profile:
             players_not_found.append(name)
             return None
+        player_info = profile["info"]
 
         display_name = player_info.get("display_name", name)
 
@@ -219,24 +292,22 @@ def get_trade_context(
 
         # Season stats (includes fantasy_points and fantasy_points_ppr per category)
         season_stats: dict = {}
-        for label, stat_key in [
-            ("receiving", "receivingStats"),
-            ("passing", "passingStats"),
-            ("rushing", "rushingStats"),
-        ]:
-            stats = profile.get(stat_key, [])
+        for label, _ in _PROFILE_STAT_KEYS:
+            stats = profile[label]
             if stats:
                 season_stats[label] = stats
-                for row in stats:
-                    s = row.get("season")
-                    if s and (data_season is None or s > data_season):
-                        data_season = s
+                seasons = [row["season"] for row in stats if row.get("season")]
+                if seasons:
+                    data_season = max(data_season or 0, max(seasons))
         bundle["season_stats"] = season_stats
 
-        # Dynasty ranking lookup (try input name, then display name)
-        rank_data = rankings_by_name.get(name.lower())
-        if not rank_data:
-            rank_data = rankings_by_name.get(display_name.lower())
+        # Dynasty ranking from the trade card; players without consistency rows
+        # (e.g. rookies) fall back to the cached rankings (input name, then display name)
+        card = trade_cards.get(name)
+        if card and card.get("ecr") is not None:
+            rank_data = {"ecr": card["ecr"], "pos": card.get("rank_pos"), "team": card.get("rank_team")}
+        else:
+            rank_data = rankings_by_name.get(name.lower()) or rankings_by_name.get(display_name.lower())
 
         if rank_data:
             bundle["dynasty_ranking"] = {
@@ -249,7 +320,7 @@ def get_trade_context(
             rankings_not_found.append(display_name)
 
         # Consistency metrics
-        bundle["consistency"] = consistency.get(name)
+        bundle["consistency"] = {k: v for k, v in card.items() if k not in _CARD_RANK_COLS} if card else None
 
         # Weekly trend (if requested)
         if include_weekly:
@@ -257,17 +328,10 @@ def get_trade_context(
 
         return bundle
 
-    give_side = []
-    for name in give_player_names:
-        bundle = _build_player_bundle(name)
-        if bundle:
-            give_side.append(bundle)
-
-    receive_side = []
-    for name in receive_player_names:
-        bundle = _build_player_bundle(name)
-        if bundle:
-            receive_side.append(bundle)
+    # Build each distinct player once, then split into sides
+    bundles_by_name = {name: _build_player_bundle(name) for name in all_names}
+    give_side = [b for name in give_player_names if (b := bundles_by_name.get(name))]
+    receive_side = [b for name in receive_player_names if (b := bundles_by_name.get(name))]
 
     return {
         "give_side": give_side,
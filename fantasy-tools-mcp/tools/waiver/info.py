@@ -3,22 +3,52 @@ Waiver wire context composite tool for assembling pickup decision data.
 
 Fetches trending players from Sleeper, enriches each with season stats including
 positional percentile ranks, consistency metrics, dynasty rankings, and league
-roster availability. All internal fetches run in parallel via ThreadPoolExecutor.
+roster availability. All internal fetches run in parallel on the shared fetch pool, with
+one batched query per data category covering every trending player. Receiving,
+passing, and rushing season stats come back together from the player_season_card RPC.
 Returns a data-only bundle with zero analysis or opinions — the LLM interprets the data.
 """
 
-from concurrent.futures import ThreadPoolExecutor
+import logging
+import threading
+import time
+from concurrent.futures import Future, as_completed
 
 from supabase import Client
 
-from helpers.query_utils import build_player_stats_query
+from helpers.executor_utils import FETCH_EXECUTOR
+from helpers.query_utils import query_player_season_card, query_rows_per_name
+from helpers.retry_utils import retry_with_backoff
 from tools.fantasy.info import get_sleeper_league_rosters, get_sleeper_trending_players
-from tools.metrics.info import (
-    get_advanced_passing_stats,
-    get_advanced_receiving_stats,
-    get_advanced_rushing_stats,
-)
-from tools.ranks.info import get_fantasy_ranks
+from tools.ranks.cache import get_cached_rankings_by_name
+
+logger = logging.getLogger(__name__)
+
+# Batch queries get one quick retry on transient errors (connection, timeout, 5xx),
+# which overlaps with the sibling category queries still in flight
+_query_retry = retry_with_backoff(max_attempts=2, initial_delay=0.1, max_delay=0.1, jitter=0.05)
+
+# Batched queries request this multiple of the per-player row count for each name
+_BATCH_HEADROOM = 2
+
+# Trending players requested per top_n slot when a position_filter will discard some
+_POSITION_OVERSAMPLE = 4
+
+# Columns every season-stats row carries (merge_name keys rows back to names)
+_SEASON_BASE_COLS = ["season", "player_name", "ff_team", "ff_position", "merge_name"]
+
+# Positions each season-stats view covers (mirrors their default_positions)
+_RECEIVING_POSITIONS = frozenset({"WR", "TE", "RB"})
+_PASSING_POSITIONS = frozenset({"QB"})
+_RUSHING_POSITIONS = frozenset({"RB", "QB"})
+
+# Rosters only change on adds, drops, and trades, so back-to-back waiver calls for
+# one league (e.g. with a different position_filter) reuse the last fetch briefly.
+# Trending players are never cached; they are the part that legitimately moves.
+_ROSTERS_TTL = 60
+# league_id -> (full rosters, fetched_at)
+_rosters_cache: dict[str, tuple[list[dict], float]] = {}
+_rosters_cache_lock = threading.Lock()
 
 # Position-appropriate metrics (043)
 # Receiving pctile columns live in mv_receiving_percentile_ranks (separate MV)
@@ -42,6 +72,7 @@ _RECEIVING_PCTILE_COLS = [
     "fantasy_points_ppr_pctile",
     "catch_percentage_pctile",
 ]
+_RECEIVING_PCTILE_SET = frozenset(_RECEIVING_PCTILE_COLS)
 
 _PASSING_METRICS = [
     "passing_yards",
@@ -71,6 +102,56 @@ _RUSHING_METRICS = [
     "avg_rush_yards_pctile",
 ]
 
+# Columns player_season_card returns per category
+_SEASON_CARD_COLS = {
+    "receiving": [*_SEASON_BASE_COLS, *_RECEIVING_METRICS],
+    "passing": [*_SEASON_BASE_COLS, *_PASSING_METRICS],
+    "rushing": [*_SEASON_BASE_COLS, *_RUSHING_METRICS],
+}
+
+
+def _merge_receiving_pctile(receiving: dict[str, list[dict]], recv_pctile: dict[str, list[dict]]) -> set[str]:
+    """
+    Copy mv_receiving_percentile_ranks columns onto each player's matching receiving season rows.
+
+    Returns:
+        set: Names that received at least one percentile column
+    """
+    merged: set[str] = set()
+    for name, recv_rows in receiving.items():
+        pctile_rows = recv_pctile.get(name)
+        if recv_rows and pctile_rows:
+            pctile_by_season = {r.get("season"): r for r in pctile_rows}
+            for row in recv_rows:
+                pctile = pctile_by_season.get(row.get("season"))
+                if pctile:
+                    row.update({k: v for k, v in pctile.items() if k in _RECEIVING_PCTILE_SET})
+                    merged.add(name)
+    return merged
+
+
+def _get_cached_rosters(supabase: Client, league_id: str) -> list[dict]:
+    """Return a league's full rosters, refetching when the cached copy is stale.
+
+    Failed fetches raise and leave nothing cached. The returned list is shared
+    between callers and must not be mutated.
+    """
+    with _rosters_cache_lock:
+        entry = _rosters_cache.get(league_id)
+        if entry and (time.monotonic() - entry[1]) <= _ROSTERS_TTL:
+            return entry[0]
+
+    rosters = get_sleeper_league_rosters(league_id, summary=False, supabase=supabase)
+    with _rosters_cache_lock:
+        _rosters_cache[league_id] = (rosters, time.monotonic())
+    return rosters
+
+
+def clear_waiver_cache() -> None:
+    """Drop cached league rosters so the next waiver call refetches them."""
+    with _rosters_cache_lock:
+        _rosters_cache.clear()
+
 
 def get_waiver_context(
     supabase: Client,
@@ -85,8 +166,10 @@ def get_waiver_context(
     Fetches trending players from Sleeper (adds), enriches each with season stats
     including positional percentile ranks, consistency metrics, dynasty rankings,
     and checks roster availability in the specified league. Phase 1 fetches trending
-    players, rankings, and rosters in parallel. Phase 2 enriches each trending
-    player with stats and consistency in parallel.
+    players, rankings, and rosters in parallel. Phase 2 enriches the trending
+    players with stats and consistency, one batched query per category, and starts
+    as soon as the trending list arrives. Season stats are only fetched for players
+    whose position the category covers.
 
     Args:
         supabase: The Supabase client instance
@@ -102,6 +185,9 @@ def get_waiver_context(
             - scoring_format: Scoring format string
             - data_season: Most recent season in the data
             - players_without_stats: Names with no stats found
+            - missing_required_data: {player_name, reason} entries for players missing
+              consistency ("consistency_unavailable") or percentile ranks
+              ("percentile_ranks_unavailable"), or None
     """
     if not league_id:
         raise ValueError("league_id is required for waiver context")
@@ -109,178 +195,172 @@ def get_waiver_context(
     safe_top_n = min(max(int(top_n), 1), 25)
 
     # --- Internal fetch functions ---
+    # Phase 2 fetchers run once for all trending players and split rows back per name.
+    # The batch limit leaves _BATCH_HEADROOM for partial-match neighbours (e.g. a second
+    # "Jefferson"); query_rows_per_name re-queries any player a full batch cut short.
+    # They retry transient failures and raise otherwise; Phase 2 collection degrades
+    # a failed category to empty results.
+
+    # Sleeper's trending endpoint can't filter by position, so a filtered request
+    # oversamples and trims after filtering. Trending adds are roughly position-agnostic,
+    # so _POSITION_OVERSAMPLE x top_n typically still fills the list.
+    trending_limit = safe_top_n * _POSITION_OVERSAMPLE if position_filter else safe_top_n
 
     def _fetch_trending() -> list[dict]:
         try:
             return get_sleeper_trending_players(
-                sport="nfl", add_drop="add", hours=24, limit=safe_top_n, supabase=supabase
+                sport="nfl", add_drop="add", hours=24, limit=trending_limit, supabase=supabase
             )
         except Exception:
             return []
 
-    def _fetch_dynasty_ranks() -> list[dict]:
+    def _fetch_dynasty_ranks() -> dict[str, dict]:
         try:
-            return get_fantasy_ranks(supabase=supabase, limit=500)
+            return get_cached_rankings_by_name(supabase)
         except Exception:
-            return []
+            return {}
 
     def _fetch_rosters() -> list[dict]:
         try:
-            return get_sleeper_league_rosters(league_id, summary=False, supabase=supabase)
-        except Exception:
-            return []
-
-    def _fetch_receiving(name: str) -> list[dict]:
-        try:
-            result = get_advanced_receiving_stats(
-                supabase=supabase, player_names=[name], metrics=_RECEIVING_METRICS, limit=3
-            )
-            return result.get("advReceivingStats", [])
-        except Exception:
-            return []
-
-    def _fetch_passing(name: str) -> list[dict]:
-        try:
-            result = get_advanced_passing_stats(
-                supabase=supabase, player_names=[name], metrics=_PASSING_METRICS, limit=3
-            )
-            return result.get("advPassingStats", [])
+            return _get_cached_rosters(supabase, league_id)
         except Exception:
             return []
 
-    def _fetch_rushing(name: str) -> list[dict]:
-        try:
-            result = get_advanced_rushing_stats(
-                supabase=supabase, player_names=[name], metrics=_RUSHING_METRICS, limit=3
-            )
-            return result.get("advRushingStats", [])
-        except Exception:
-            return []
+    @_query_retry
+    def _fetch_season_card(names_by_category: dict[str, list[str]]) -> dict[str, dict[str, list[dict]]]:
+        by_name = query_player_season_card(supabase, names_by_category, _SEASON_CARD_COLS)
+        return {
+            cat: {n: (by_name.get(n) or {}).get(cat, []) for n in names} for cat, names in names_by_category.items()
+        }
 
-    def _fetch_receiving_pctile(name: str) -> list[dict]:
-        try:
-            result = build_player_stats_query(
-                supabase=supabase,
-                table_name="mv_receiving_percentile_ranks",
-                base_columns=["merge_name", "ff_position", "season"],
-                player_name_column="merge_name",
-                position_column="ff_position",
-                default_positions=["WR", "TE", "RB"],
-                return_key="recvPctile",
-                player_names=[name],
-                metrics=_RECEIVING_PCTILE_COLS,
-                limit=3,
-            )
-            return result.get("recvPctile", [])
-        except Exception:
-            return []
+    @_query_retry
+    def _fetch_receiving_pctile(names: list[str]) -> dict[str, list[dict]]:
+        return query_rows_per_name(
+            supabase,
+            names,
+            ["merge_name"],
+            3,
+            headroom=_BATCH_HEADROOM,
+            table_name="mv_receiving_percentile_ranks",
+            base_columns=["merge_name", "ff_position", "season"],
+            player_name_column="merge_name",
+            position_column="ff_position",
+            default_positions=["WR", "TE", "RB"],
+            return_key="recvPctile",
+            metrics=_RECEIVING_PCTILE_COLS,
+        )
 
-    def _fetch_consistency(name: str) -> dict | None:
-        try:
-            result = build_player_stats_query(
-                supabase=supabase,
-                table_name="mv_player_consistency",
-                base_columns=[
-                    "player_name",
-                    "merge_name",
-                    "season",
-                    "ff_position",
-                    "games_played",
-                    "avg_fp_ppr",
-                    "fp_stddev_ppr",
-                    "fp_floor_p10",
-                    "fp_ceiling_p90",
-                    "fp_median_ppr",
-                    "boom_games_20plus",
-                    "bust_games_under_5",
-                    "consistency_coefficient",
-                ],
-                player_name_column="merge_name",
-                position_column="ff_position",
-                default_positions=["QB", "RB", "WR", "TE"],
-                return_key="consistency",
-                player_names=[name],
-                limit=1,
-            )
-            data = result.get("consistency", [])
-            return data[0] if data else None
-        except Exception:
-            return None
+    @_query_retry
+    def _fetch_consistency(names: list[str]) -> dict[str, dict | None]:
+        grouped = query_rows_per_name(
+            supabase,
+            names,
+            ["merge_name"],
+            1,
+            headroom=_BATCH_HEADROOM,
+            table_name="mv_player_consistency",
+            base_columns=[
+                "player_name",
+                "merge_name",
+                "season",
+                "ff_position",
+                "games_played",
+                "avg_fp_ppr",
+                "fp_stddev_ppr",
+                "fp_floor_p10",
+                "fp_ceiling_p90",
+                "fp_median_ppr",
+                "boom_games_20plus",
+                "bust_games_under_5",
+                "consistency_coefficient",
+            ],
+            player_name_column="merge_name",
+            position_column="ff_position",
+            default_positions=["QB", "RB", "WR", "TE"],
+            return_key="consistency",
+        )
+        return {n: rows[0] if rows else None for n, rows in grouped.items()}
 
     # --- Phase 1: Fetch trending players, rankings, and rosters in parallel ---
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        trending_future = executor.submit(_fetch_trending)
-        rankings_future = executor.submit(_fetch_dynasty_ranks)
-        rosters_future = executor.submit(_fetch_rosters)
+    # Only the trending list gates Phase 2; rankings and rosters keep running
+    # on the shared pool while the stats queries are in flight.
+    trending_future = FETCH_EXECUTOR.submit(_fetch_trending)
+    rankings_future = FETCH_EXECUTOR.submit(_fetch_dynasty_ranks)
+    rosters_future = FETCH_EXECUTOR.submit(_fetch_rosters)
 
-        trending_raw = trending_future.result()
-        all_rankings = rankings_future.result()
-        rosters = rosters_future.result()
+    trending_raw = trending_future.result()
 
     # Apply position filter if specified
     if position_filter:
         pos_upper = position_filter.upper()
-        trending_raw = [p for p in trending_raw if (p.get("position") or "").upper() == pos_upper]
+        trending_raw = [p for p in trending_raw if (p.get("position") or "").upper() == pos_upper][:safe_top_n]
+
+    # --- Phase 2: Enrich trending players with stats and consistency (one query per category) ---
+    # Each trending player's name is resolved once and reused for enrichment and assembly
+    trending_named = [(name, tp) for tp in trending_raw if (name := tp.get("player_name") or tp.get("display_name"))]
+    pos_by_name: dict[str, str] = {}
+    for name, tp in trending_named:
+        pos_by_name.setdefault(name, (tp.get("position") or "").upper())
+    player_names_to_enrich = list(pos_by_name)
+
+    def _names_for(positions: frozenset[str]) -> list[str]:
+        # A stats view only holds its own positions; unknown positions get every category
+        return [n for n, pos in pos_by_name.items() if not pos or pos in positions]
+
+    # Receiving, passing, and rushing come back together from the player_season_card RPC
+    names_by_category = {
+        "receiving": _names_for(_RECEIVING_POSITIONS),
+        "passing": _names_for(_PASSING_POSITIONS),
+        "rushing": _names_for(_RUSHING_POSITIONS),
+    }
+    phase2_futures: dict[str, Future] = {}
+    for key, fetch, names in [
+        ("season_card", _fetch_season_card, names_by_category if any(names_by_category.values()) else None),
+        ("recv_pctile", _fetch_receiving_pctile, names_by_category["receiving"]),
+        ("consistency", _fetch_consistency, player_names_to_enrich),
+    ]:
+        if names:
+            phase2_futures[key] = FETCH_EXECUTOR.submit(fetch, names)
+
+    rankings_by_name = rankings_future.result()
+    rosters = rosters_future.result()
 
     # Build rostered player IDs set for availability check
-    rostered_ids: set[str] = set()
-    for roster in rosters:
-        players = roster.get("players") or []
-        rostered_ids.update(str(pid) for pid in players)
-
-    # Build rankings lookup
-    rankings_by_name: dict[str, dict] = {}
-    for entry in all_rankings:
-        pname = entry.get("player", "").lower()
-        if pname:
-            rankings_by_name[pname] = entry
-
-    # --- Phase 2: Enrich each trending player with stats and consistency ---
-    player_names_to_enrich = []
-    for tp in trending_raw:
-        name = tp.get("player_name") or tp.get("display_name")
-        if name:
-            player_names_to_enrich.append(name)
-
-    worker_count = len(player_names_to_enrich) * 5  # recv + recv_pctile + pass + rush + consistency
-    max_workers = min(max(worker_count, 1), 12)
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        recv_futures = {n: executor.submit(_fetch_receiving, n) for n in player_names_to_enrich}
-        recv_pctile_futures = {n: executor.submit(_fetch_receiving_pctile, n) for n in player_names_to_enrich}
-        pass_futures = {n: executor.submit(_fetch_passing, n) for n in player_names_to_enrich}
-        rush_futures = {n: executor.submit(_fetch_rushing, n) for n in player_names_to_enrich}
-        consistency_futures = {n: executor.submit(_fetch_consistency, n) for n in player_names_to_enrich}
-
-        receiving = {n: f.result() for n, f in recv_futures.items()}
-        recv_pctile = {n: f.result() for n, f in recv_pctile_futures.items()}
-        passing = {n: f.result() for n, f in pass_futures.items()}
-        rushing = {n: f.result() for n, f in rush_futures.items()}
-        consistency = {n: f.result() for n, f in consistency_futures.items()}
-
-    # --- Merge receiving percentile ranks from MV into receiving stats ---
-    for name in player_names_to_enrich:
-        recv_rows = receiving.get(name, [])
-        pctile_rows = recv_pctile.get(name, [])
-        if recv_rows and pctile_rows:
-            pctile_by_season = {r.get("season"): r for r in pctile_rows}
-            for row in recv_rows:
-                pctile = pctile_by_season.get(row.get("season"))
-                if pctile:
-                    for col in _RECEIVING_PCTILE_COLS:
-                        if col in pctile:
-                            row[col] = pctile[col]
+    rostered_ids: set[str] = {str(pid) for roster in rosters for pid in (roster.get("players") or ())}
+
+    # --- Collect Phase 2 as each category lands ---
+    # The receiving pctile merge runs as soon as both of its inputs are in, while the
+    # slower categories are still in flight. A failed category degrades to empty results.
+    keys_by_future = {future: key for key, future in phase2_futures.items()}
+    pending_recv = {"season_card", "recv_pctile"} & phase2_futures.keys()
+    phase2: dict[str, dict] = {}
+    # Names that got pctile columns are recorded here so validation needn't rescan rows
+    pctile_merged: set[str] = set()
+    for future in as_completed(keys_by_future):
+        key = keys_by_future[future]
+        try:
+            if key == "season_card":
+                phase2.update(future.result())
+            else:
+                phase2[key] = future.result()
+        except Exception:
+            logger.warning("Waiver %s fetch failed; continuing without it", key, exc_info=True)
+        if key in pending_recv:
+            pending_recv.discard(key)
+            if not pending_recv:
+                pctile_merged = _merge_receiving_pctile(phase2.get("receiving", {}), phase2.get("recv_pctile", {}))
+    receiving: dict[str, list[dict]] = phase2.get("receiving", {})
+    passing: dict[str, list[dict]] = phase2.get("passing", {})
+    rushing: dict[str, list[dict]] = phase2.get("rushing", {})
+    consistency: dict[str, dict | None] = phase2.get("consistency", {})
 
     # --- Assemble player bundles ---
     players_without_stats: list[str] = []
+    missing_required: list[dict] = []
     data_season: int | None = None
 
     player_bundles = []
-    for tp in trending_raw:
-        player_name = tp.get("player_name") or tp.get("display_name")
-        if not player_name:
-            continue
-
+    for player_name, tp in trending_named:
         player_id = str(tp.get("player_id", ""))
         is_available = player_id not in rostered_ids if player_id else None
 
@@ -293,20 +373,18 @@ def get_waiver_context(
         }
 
         # Season stats with percentile ranks
+        recv_rows = receiving.get(player_name, [])
+        pass_rows = passing.get(player_name, [])
+        rush_rows = rushing.get(player_name, [])
         season_stats: dict = {}
         has_stats = False
-        for label, stat_data in [
-            ("receiving", receiving.get(player_name, [])),
-            ("passing", passing.get(player_name, [])),
-            ("rushing", rushing.get(player_name, [])),
-        ]:
+        for label, stat_data in [("receiving", recv_rows), ("passing", pass_rows), ("rushing", rush_rows)]:
             if stat_data:
                 season_stats[label] = stat_data
                 has_stats = True
-                for row in stat_data:
-                    s = row.get("season")
-                    if s and (data_season is None or s > data_season):
-                        data_season = s
+                seasons = [row["season"] for row in stat_data if row.get("season")]
+                if seasons:
+                    data_season = max(data_season or 0, max(seasons))
         bundle["season_stats"] = season_stats
 
         if not has_stats:
@@ -315,6 +393,13 @@ def get_waiver_context(
         # Consistency metrics (required)
         bundle["consistency"] = consistency.get(player_name)
 
+        # Validate required fields (percentile ranks + consistency)
+        if bundle["consistency"] is None:
+            missing_required.append({"player_name": player_name, "reason": "consistency_unavailable"})
+        # Passing/rushing rows carry their pctile columns inline (see _PASSING_METRICS)
+        if season_stats and not (player_name in pctile_merged or pass_rows or rush_rows):
+            missing_required.append({"player_name": player_name, "reason": "percentile_ranks_unavailable"})
+
         # Dynasty ranking
         rank_data = rankings_by_name.get(player_name.lower())
         if rank_data:
@@ -328,19 +413,6 @@ def get_waiver_context(
 
         player_bundles.append(bundle)
 
-    # --- Validate required fields (percentile ranks + consistency) ---
-    missing_required: list[str] = []
-    for bundle in player_bundles:
-        pname = bundle["player_name"]
-        if bundle.get("consistency") is None:
-            missing_required.append(f"{pname}: consistency metrics unavailable")
-        stats = bundle.get("season_stats", {})
-        has_pctile = any(
-            any(k.endswith("_pctile") for k in row) for cat in stats.values() if isinstance(cat, list) for row in cat
-        )
-        if stats and not has_pctile:
-            missing_required.append(f"{pname}: positional percentile ranks unavailable")
-
     return {
         "trending_players": player_bundles,
         "league_id": league_id,
@@ -37,7 +37,9 @@ def register_tools(mcp: FastMCP, supabase: Client):
             "- top_n: Number of trending players to evaluate (default 10, max 25)\n\n"
             "Each player bundle includes: trending add count, roster availability in your league, "
             "season stats with positional percentile ranks, consistency metrics "
-            "(avg FP, floor/ceiling, boom/bust), and dynasty ranking.\n\n"
+            "(avg FP, floor/ceiling, boom/bust), and dynasty ranking. missing_required_data lists "
+            "{player_name, reason} entries with reason 'consistency_unavailable' or "
+            "'percentile_ranks_unavailable'.\n\n"
             "Keywords: waiver wire, free agent, pickup, must-add, streaming, roster move, "
             "add/drop, FAAB, waiver priority, league winner"
         ),
@@ -2,11 +2,39 @@
 Web search tools for fantasy football research and analysis.
 """
 
+import atexit
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from tavily import TavilyClient
 
-from helpers.retry_utils import retry_with_backoff
+from helpers.retry_utils import is_retryable_http_error, retry_with_backoff
+
+# Upper bound on queries per search_web_batch call
+_MAX_BATCH_QUERIES = 8
+
+# Web searches get their own small pool rather than the shared FETCH_EXECUTOR:
+# search_web retries with backoff sleeps, and a slow or failing Tavily batch must
+# not hold the workers composite tools need for their Supabase fetches.
+_SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=_MAX_BATCH_QUERIES, thread_name_prefix="bill2-websearch")
+atexit.register(_SEARCH_EXECUTOR.shutdown)
+
+# One client per process, so every search reuses the same configured client
+# instead of building a new one per call.
+_tavily_client: TavilyClient | None = None
+_tavily_client_key: str | None = None
+_tavily_client_lock = threading.Lock()
+
+
+def _get_tavily_client(api_key: str) -> TavilyClient:
+    """Return the shared TavilyClient, rebuilding it only if the API key changes."""
+    global _tavily_client, _tavily_client_key
+    with _tavily_client_lock:
+        if _tavily_client is None or _tavily_client_key != api_key:
+            _tavily_client = TavilyClient(api_key=api_key)
+            _tavily_client_key = api_key
+        return _tavily_client
 
 
 @retry_with_backoff()
@@ -49,8 +77,7 @@ def search_web(query: str, max_results: int = 5) -> dict:
                 "query": query,
             }
 
-        # Initialize client
-        client = TavilyClient(api_key=api_key)
+        client = _get_tavily_client(api_key)
 
         # Limit max_results to reasonable bounds (1-10)
         max_results = min(max(1, max_results), 10)
@@ -90,5 +117,41 @@ def search_web(query: str, max_results: int = 5) -> dict:
 
     except Exception as e:
         # Let retry_with_backoff handle retryable errors
-        # For non-retryable errors or exhausted retries, raise with context
+        if is_retryable_http_error(e):
+            raise
+        # For non-retryable errors, raise with context
         raise Exception(f"Error performing web search for query '{query}': {e!s}") from None
+
+
+def search_web_batch(queries: list[str], max_results: int = 5) -> list[dict]:
+    """
+    Run several web searches concurrently and return their results in query order.
+
+    Each query goes through search_web (with its own retries) on a dedicated web
+    search pool, so k searches take about as long as the slowest one instead of the sum.
+    A query that still fails after retries yields an error entry instead of failing
+    the whole batch.
+
+    Args:
+        queries: Search query strings (1-8), e.g. ["CMC injury update", "Mahomes status"]
+        max_results: Maximum number of results per query (default: 5, max: 10)
+
+    Returns:
+        List with one search_web-style dict per query, in the same order as queries
+
+    Raises:
+        ValueError: If queries is empty or has more than 8 entries
+    """
+    if not queries:
+        raise ValueError("queries must contain at least one search query")
+    if len(queries) > _MAX_BATCH_QUERIES:
+        raise ValueError(f"Maximum {_MAX_BATCH_QUERIES} queries per batch")
+
+    futures = [_SEARCH_EXECUTOR.submit(search_web, query, max_results) for query in queries]
+    results = []
+    for query, future in zip(queries, futures, strict=True):
+        try:
+            results.append(future.result())
+        except Exception as e:
+            results.append({"error": str(e), "results": [], "query": query})
+    return results
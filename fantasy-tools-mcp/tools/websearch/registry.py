@@ -1,7 +1,7 @@
 from fastmcp import FastMCP
 from supabase import Client
 
-from .info import search_web
+from .info import search_web, search_web_batch
 
 # Web search queries external APIs but is still read-only and non-destructive.
 # openWorldHint=True because results depend on external web state.
@@ -28,3 +28,14 @@ def register_tools(mcp: FastMCP, supabase: Client):
     )
     def search_web_tool(query: str, max_results: int = 5) -> dict:
         return search_web(query, max_results)
+
+    @mcp.tool(
+        annotations=_TOOL_ANNOTATIONS,
+        description=(
+            "Run up to 8 web searches concurrently and return each query's results in order. "
+            "Prefer this over repeated search_web_tool calls when you already know you need two or more "
+            "searches (e.g. injury news for several players): total latency is about that of the slowest single search."
+        ),
+    )
+    def search_web_batch_tool(queries: list[str], max_results: int = 5) -> list[dict]:
+        return search_web_batch(queries, max_results)